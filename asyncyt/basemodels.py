@@ -258,7 +258,8 @@ class PlaylistConfig(BaseModel):
     :param max_videos: Maximum number of videos to download (0 = all).
     :param start_index: 1-based playlist index to start from.
     :param end_index: 1-based playlist index to stop at (inclusive). ``None`` = end.
-    :param concurrency: How many videos to download simultaneously (1 = sequential).
+    :param concurrency: How many videos to download simultaneously (default 4).
+                        1 downloads sequentially through a single yt-dlp process.
     :param skip_on_error: If True, log failed items and continue; otherwise abort.
     :param reverse: Download playlist in reverse order.
     :param write_playlist_metadata: Write a ``playlist.json`` file with
@@ -300,7 +301,7 @@ class PlaylistConfig(BaseModel):
         ),
     )
     concurrency: int = Field(
-        default=1,
+        default=4,
         ge=1,
         le=8,
         description="Number of simultaneous video downloads (1 = sequential)",
@@ -415,7 +416,7 @@ class PlaylistDownloadProgress(BaseModel):
         default_factory=dict,
         description="Mapping of active video URLs to their PlaylistVideoInfo",
     )
-    active_downloads_progress: Dict[str, DownloadProgress] = Field(
+    active_downloads_progress: Dict[str, "DownloadProgress"] = Field(
         default_factory=dict,
         description="Mapping of active video URLs to their live DownloadProgress",
     )
@@ -451,11 +452,15 @@ class DownloadConfig(BaseModel):
     :param write_live_chat: Download live chat replay.
     :param custom_filename: Custom yt-dlp output template.
     :param cookies_file: Path to a Netscape cookies file.
+    :param archive_file: yt-dlp ``--download-archive`` file.  Finished videos are
+                         recorded in it and skipped on later runs.
     :param proxy: Proxy URL.
     :param rate_limit: Download rate limit (e.g. ``"1M"``, ``"500K"``).
     :param retries: yt-dlp retry count.
     :param fragment_retries: yt-dlp fragment retry count.
     :param custom_options: Extra yt-dlp options passed as ``{key: value}``.
+    :param progress_interval: Minimum seconds between progress callbacks
+                              (0 = every update). The final callback always fires.
     :param encoding: Fine-grained FFmpeg encoding settings.
     """
 
@@ -482,6 +487,9 @@ class DownloadConfig(BaseModel):
     cookies_file: Optional[str] = Field(
         default=None, description="Path to cookies file"
     )
+    archive_file: Optional[str] = Field(
+        default=None, description="yt-dlp download archive file"
+    )
     proxy: Optional[str] = Field(default=None, description="Proxy URL")
     rate_limit: Optional[str] = Field(
         default=None, description="Rate limit e.g. '1M' or '500K'"
@@ -496,6 +504,11 @@ class DownloadConfig(BaseModel):
     custom_options: Dict[str, Any] = Field(
         default_factory=dict, description="Custom yt-dlp options"
     )
+    progress_interval: float = Field(
+        default=0.1,
+        ge=0,
+        description="Minimum seconds between progress callbacks (0 = every update)",
+    )
     encoding: Optional[EncodingConfig] = Field(
         default=None,
         description="Fine-grained video/audio encoding settings.",
@@ -771,6 +784,7 @@ class HealthResponse(BaseModel):
     yt_dlp_available: bool = False
     ffmpeg_available: bool = False
     version: str = "1.0.0"
+    yt_dlp_version: Optional[str] = None
     binaries_path: Optional[str] = None
     error: Optional[str] = None
 
@@ -4,20 +4,24 @@ Uses yt-dlp and ffmpeg with automatic binary management
 """
 
 import asyncio
+import functools
+import hashlib
 from asyncio.subprocess import Process
 import os
 import platform
 import shutil
+import tempfile
+import time
 import zipfile
 from pathlib import Path
 from typing import (
+    IO,
     Any,
     AsyncGenerator,
+    Callable,
     Dict,
-    List,
     Optional,
 )
-import aiofiles
 import aiohttp
 import logging
 
@@ -32,6 +36,35 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["BinaryManager"]
 
+_SYSTEM = platform.system().lower()
+_IS_WIN = _SYSTEM == "windows"
+_IS_MAC = _SYSTEM == "darwin"
+
+# yt-dlp release asset names double as the local binary names.
+_YTDLP_NAME = "yt-dlp.exe" if _IS_WIN else "yt-dlp_macos" if _IS_MAC else "yt-dlp"
+_YTDLP_URL = f"https://github.com/yt-dlp/yt-dlp/releases/latest/download/{_YTDLP_NAME}"
+# Only used on Windows; Linux uses the system ffmpeg and macOS installs via brew.
+_FFMPEG_URL = (
+    "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/"
+    "ffmpeg-n7.1-latest-win64-gpl-7.1.zip"
+)
+
+# Read size for binary downloads. yt-dlp / FFmpeg archives are 30–100 MB,
+# so small chunks mostly add per-chunk await and progress overhead.
+_CHUNK_SIZE = 1 << 18  # 256 KiB
+# Bytes gathered before each off-thread write of a binary download.
+_WRITE_BUFFER = 1 << 20  # 1 MiB
+
+# How long (seconds) a health_check result is reused before re-probing.
+_HEALTH_TTL = 30.0
+
+
+def _write_all(fd: int, data: bytes | bytearray) -> None:
+    """``os.write`` until every byte of *data* has been written to *fd*."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
 
 class BinaryManager:
     """
@@ -48,78 +81,230 @@ class BinaryManager:
         if bin_dir and bin_dir.exists() and not bin_dir.is_dir():
             raise ValueError(f"Path {bin_dir} not dir!")
         self.bin_dir = bin_dir or Path.cwd() / "bin"
-        system = platform.system().lower()
+        self.ytdlp_path = self.bin_dir / _YTDLP_NAME
+        self.ffmpeg_path = self.bin_dir / "ffmpeg.exe" if _IS_WIN else "ffmpeg"
+        self.ffprobe_path = self.bin_dir / "ffprobe.exe" if _IS_WIN else "ffprobe"
+        self._downloads: Dict[str, Process] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        # (monotonic timestamp, result) of the last health_check
+        self._health_cache: Optional[tuple[float, HealthResponse]] = None
+        # (yt-dlp binary mtime, `yt-dlp --version` output)
+        self._ytdlp_version: Optional[tuple[float, str]] = None
 
-        if system == "darwin":
-            self.ytdlp_path = self.bin_dir / "yt-dlp_macos"
-        elif system == "windows":
-            self.ytdlp_path = self.bin_dir / "yt-dlp.exe"
-        else:
-            self.ytdlp_path = self.bin_dir / "yt-dlp"
+    async def __aenter__(self):
+        return self
 
-        self.ffmpeg_path = (
-            self.bin_dir / "ffmpeg.exe" if system == "windows" else "ffmpeg"
-        )
-        self.ffprobe_path = (
-            self.bin_dir / "ffprobe.exe" if system == "windows" else "ffprobe"
-        )
-        self._downloads: Dict[str, Process] = {}
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        Reusing one session lets the binary downloads of a setup run share
+        the connection pool (and its DNS cache / keep-alive connections).
+        The setup methods close it again when they finish.
+
+        :return: The shared :class:`aiohttp.ClientSession`.
+        :rtype: aiohttp.ClientSession
+        """
+        if self._session is None or self._session.closed:
+            timeout_obj = aiohttp.ClientTimeout(
+                total=None, sock_connect=30, sock_read=300
+            )
+            self._session = aiohttp.ClientSession(
+                timeout=timeout_obj,
+                connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP session, if one was opened.
+
+        :return: None
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @staticmethod
+    async def _drain(source: AsyncGenerator[SetupProgress, Any]) -> None:
+        """Run a setup generator to completion, discarding its progress."""
+        async for _ in source:
+            pass
+
+    @classmethod
+    async def _drain_all(cls, *sources: AsyncGenerator[SetupProgress, Any]) -> None:
+        """
+        Run several setup generators concurrently, discarding their progress.
+
+        Like :meth:`_merge_progress`, the first error from any source is
+        re-raised and the others are cancelled.
+
+        :param sources: Setup generators to run.
+        :return: None
+        """
+        try:
+            async with asyncio.TaskGroup() as group:
+                for source in sources:
+                    group.create_task(cls._drain(source))
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+
+    @staticmethod
+    async def _merge_progress(
+        *sources: AsyncGenerator[SetupProgress, Any],
+    ) -> AsyncGenerator[SetupProgress, Any]:
+        """
+        Run several setup generators concurrently, yielding progress as it arrives.
+
+        The first error from any source is re-raised and the others are cancelled.
+
+        :param sources: Setup generators to interleave.
+        :return: Async generator yielding SetupProgress objects.
+        :rtype: AsyncGenerator[SetupProgress, Any]
+        """
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        finished = object()
+
+        async def run(source: AsyncGenerator[SetupProgress, Any]) -> None:
+            try:
+                async for item in source:
+                    queue.put_nowait(item)
+                queue.put_nowait(finished)
+            except Exception as e:
+                queue.put_nowait(e)
+
+        tasks = [asyncio.create_task(run(source)) for source in sources]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is finished:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def setup_binaries_generator(self) -> AsyncGenerator[SetupProgress, Any]:
         """
         Download and setup yt-dlp and ffmpeg binaries, yielding SetupProgress.
 
+        Both binaries are set up concurrently, so progress for yt-dlp and
+        ffmpeg is interleaved; use ``SetupProgress.file`` to tell them apart.
+
         :return: Async generator yielding SetupProgress objects.
         :rtype: AsyncGenerator[SetupProgress, Any]
         """
         self.bin_dir.mkdir(exist_ok=True)
 
-        # Setup yt-dlp
-        async for progress in self._setup_ytdlp():
-            yield progress
-
-        # Setup ffmpeg
-        async for progress in self._setup_ffmpeg():
-            yield progress
-
+        try:
+            async for progress in self._merge_progress(
+                self._setup_ytdlp(), self._setup_ffmpeg()
+            ):
+                yield progress
+        finally:
+            await self.aclose()
+
+        self._health_cache = None
         logger.info("All binaries are ready!")
 
     async def setup_binaries(self) -> None:
         """
         Download and setup yt-dlp and ffmpeg binaries.
 
+        The two downloads are independent and run concurrently.
+
         :return: None
         """
         self.bin_dir.mkdir(exist_ok=True)
 
-        # Setup yt-dlp
-        async for _ in self._setup_ytdlp():
-            pass
-
-        # Setup ffmpeg
-        async for _ in self._setup_ffmpeg():
-            pass
+        try:
+            await self._drain_all(self._setup_ytdlp(), self._setup_ffmpeg())
+        finally:
+            await self.aclose()
 
+        self._health_cache = None
         logger.info("All binaries are ready!")
 
-    async def _setup_ytdlp(self) -> AsyncGenerator[SetupProgress, Any]:
+    async def update_binaries(self) -> None:
         """
-        Ensure yt-dlp binary is available and up-to-date.
+        Check yt-dlp and ffmpeg for newer releases and download them if found.
 
-        :return: Async generator yielding SetupProgress objects.
+        Uses the ETag saved from the previous download, so an up-to-date
+        binary costs a single ``304 Not Modified`` round-trip.
+
+        :return: None
         """
-        system = platform.system().lower()
+        self.bin_dir.mkdir(exist_ok=True)
 
-        if system == "windows":
-            url = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp.exe"
-        elif system == "darwin":
-            url = (
-                "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp_macos"
+        try:
+            await self._drain_all(
+                self._setup_ytdlp(force=True), self._setup_ffmpeg(force=True)
             )
-        else:
-            url = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp"
+        finally:
+            await self.aclose()
+
+        self._health_cache = None
+        logger.info("All binaries are up to date!")
+
+    @staticmethod
+    def _etag_path(path: Path) -> Path:
+        """Sidecar file holding the ETag of the last download of *path*."""
+        return path.with_suffix(path.suffix + ".etag")
+
+    @staticmethod
+    def _digest_path(path: Path) -> Path:
+        """Sidecar file holding the SHA-256 of the last download of *path*."""
+        return path.with_suffix(path.suffix + ".sha256")
+
+    @staticmethod
+    def _file_sha256(path: Path) -> "hashlib._Hash":
+        """Hash an existing file in ``_CHUNK_SIZE`` blocks (run in a thread)."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest
+
+    async def _verify_digest(self, path: Path) -> bool:
+        """
+        Check *path* against its ``.sha256`` sidecar.
+
+        :return: False only when a sidecar exists and the hash differs.
+        """
+        digest_path = self._digest_path(path)
+        if not digest_path.exists():
+            return True
+        expected = digest_path.read_text().strip()
+        actual = (await asyncio.to_thread(self._file_sha256, path)).hexdigest()
+        return actual == expected
+
+    async def _setup_ytdlp(
+        self, force: bool = False
+    ) -> AsyncGenerator[SetupProgress, Any]:
+        """
+        Ensure yt-dlp binary is available and up-to-date.
 
-        if self.ytdlp_path.exists():
+        :param force: Check for a newer release even without a saved ETag.
+        :type force: bool
+        :return: Async generator yielding SetupProgress objects.
+        """
+        etag_path = self._etag_path(self.ytdlp_path)
+        installed = self.ytdlp_path.exists()
+        if installed and not await self._verify_digest(self.ytdlp_path):
+            # A truncated or corrupted binary must not be kept by a 304.
+            logger.warning("yt-dlp binary failed its checksum, re-downloading")
+            installed = False
+
+        if installed and not force and not etag_path.exists():
+            # Not downloaded by us (no ETag) — let yt-dlp update itself.
             yield SetupProgress(
                 file="yt-dlp",
                 download_file_progress=DownloadFileProgress(
@@ -155,11 +340,17 @@ class BinaryManager:
                 logger.warning(f"yt-dlp update encountered an error: {e}")
 
         else:
-            logger.info("Downloading yt-dlp...")
-            async for progress in self._download_file(url, self.ytdlp_path):
+            logger.info("Checking yt-dlp..." if installed else "Downloading yt-dlp...")
+            async for progress in self._download_file(
+                _YTDLP_URL,
+                self.ytdlp_path,
+                etag_path=etag_path,
+                conditional=installed,
+                digest_path=self._digest_path(self.ytdlp_path),
+            ):
                 yield SetupProgress(file="yt-dlp", download_file_progress=progress)
 
-            if system != "windows":
+            if not _IS_WIN:
                 os.chmod(self.ytdlp_path, 0o755)
 
             yield SetupProgress(
@@ -172,20 +363,21 @@ class BinaryManager:
                 ),
             )
 
-    async def _setup_ffmpeg(self) -> AsyncGenerator[SetupProgress, Any]:
+    async def _setup_ffmpeg(
+        self, force: bool = False
+    ) -> AsyncGenerator[SetupProgress, Any]:
         """
         Download ffmpeg binary.
 
+        Windows downloads the bundled build into ``bin_dir``, macOS installs it
+        via Homebrew and Linux uses the ffmpeg already on ``PATH``.
+
+        :param force: Check for a newer build even when the binaries exist.
+        :type force: bool
         :return: Async generator yielding SetupProgress objects.
         :rtype: AsyncGenerator[SetupProgress, Any]
         """
-        system = platform.system().lower()
-        self.ffmpeg_path = self.bin_dir / "ffmpeg.exe"
-        self.ffprobe_path = self.bin_dir / "ffprobe.exe"
-
-        if system == "darwin":
-            self.ffmpeg_path = "ffmpeg"
-            self.ffprobe_path = "ffprobe"
+        if _IS_MAC:
             yield SetupProgress(
                 file="ffmpeg",
                 download_file_progress=DownloadFileProgress(
@@ -228,13 +420,30 @@ class BinaryManager:
 
             return
 
-        if not self.ffmpeg_path.exists() or not self.ffprobe_path.exists():
-            logger.info(f"Downloading ffmpeg for {system.capitalize()}...")
+        if not _IS_WIN:
+            # ffmpeg_path is the system binary here; the bundled builds only
+            # ship ffmpeg.exe / ffprobe.exe for Windows.
+            if shutil.which("ffmpeg") is None:
+                logger.warning(
+                    "ffmpeg was not found on PATH; install it with your package manager"
+                )
+            yield SetupProgress(
+                file="ffmpeg",
+                download_file_progress=DownloadFileProgress(
+                    status=ProgressStatus.COMPLETED,
+                    downloaded_bytes=0,
+                    total_bytes=0,
+                    percentage=100,
+                ),
+            )
+            return
 
-            arch = "win64" if system == "windows" else "linux64"
+        installed = (self.bin_dir / "ffmpeg.exe").exists() and (
+            self.bin_dir / "ffprobe.exe"
+        ).exists()
+        if not installed or force:
+            logger.info("Downloading ffmpeg for Windows...")
 
-            url = f"https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-n7.1-latest-{arch}-gpl-7.1.zip"
-            temp_file = self.bin_dir / "ffmpeg.zip"
             progress: DownloadFileProgress = DownloadFileProgress(
                 status=ProgressStatus.DOWNLOADING,
                 downloaded_bytes=0,
@@ -242,30 +451,44 @@ class BinaryManager:
                 percentage=0,
             )
 
-            async for progress in self._download_file(url, temp_file):
+            # Archive is buffered in memory up to 64 MiB, then spills to a
+            # temp file; writes go through a worker thread either way.
+            with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as buffer:
+                async for progress in self._download_to_buffer(
+                    _FFMPEG_URL,
+                    buffer,
+                    etag_path=self.bin_dir / "ffmpeg.zip.etag",
+                    conditional=installed,
+                ):
+                    yield SetupProgress(file="ffmpeg", download_file_progress=progress)
+                if progress.status == ProgressStatus.COMPLETED:
+                    # 304 Not Modified — installed build is current
+                    return
+                progress.status = ProgressStatus.EXTRACTING
                 yield SetupProgress(file="ffmpeg", download_file_progress=progress)
-            progress.status = ProgressStatus.EXTRACTING
-            yield SetupProgress(file="ffmpeg", download_file_progress=progress)
-            await self._extract_ffmpeg_windows(temp_file)
-            temp_file.unlink()
+                await self._extract_ffmpeg_windows(buffer, overwrite=installed)
 
-    async def _extract_ffmpeg_windows(self, zip_path: Path) -> None:
+    async def _extract_ffmpeg_windows(
+        self, zip_file: Path | IO[bytes], overwrite: bool = False
+    ) -> None:
         """
         Extract only missing ffmpeg-related binaries from the Windows zip file.
 
-        :param zip_path: Path to the ffmpeg zip file.
-        :type zip_path: Path
+        :param zip_file: Path to the ffmpeg zip file, or a seekable binary file object.
+        :type zip_file: Path | IO[bytes]
+        :param overwrite: Replace binaries that already exist (used when updating).
+        :type overwrite: bool
         :return: None
         """
 
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        with zipfile.ZipFile(zip_file, "r") as zip_ref:
             for file_info in zip_ref.infolist():
                 filename = os.path.basename(file_info.filename)
                 if filename not in ["ffmpeg.exe", "ffprobe.exe"]:
                     continue
 
                 target_file = self.bin_dir / filename
-                if target_file.exists():
+                if target_file.exists() and not overwrite:
                     continue
 
                 with (
@@ -274,25 +497,203 @@ class BinaryManager:
                 ):
                     shutil.copyfileobj(source, target)
 
+    async def _download_to_buffer(
+        self,
+        url: str,
+        buffer: IO[bytes],
+        max_retries: int = 5,
+        etag_path: Optional[Path] = None,
+        conditional: bool = False,
+    ) -> AsyncGenerator[DownloadFileProgress, Any]:
+        """
+        Download a file into a binary file object with retries and size verification.
+
+        The buffer is rewound to the start once the download completes.  On a
+        ``304 Not Modified`` a single ``COMPLETED`` progress is yielded and the
+        buffer is left empty.
+
+        :param url: URL to download from.
+        :type url: str
+        :param buffer: Seekable binary file object to write into.
+        :type buffer: IO[bytes]
+        :param max_retries: Maximum number of retries.
+        :type max_retries: int
+        :param etag_path: Sidecar file the response ETag is saved to.
+        :type etag_path: Optional[Path]
+        :param conditional: Send the saved ETag as ``If-None-Match``.
+        :type conditional: bool
+        :return: Async generator yielding DownloadFileProgress objects.
+        :rtype: AsyncGenerator[DownloadFileProgress, Any]
+        :raises AsyncYTBase: If download fails after max_retries.
+        """
+        attempt = 0
+        while attempt < max_retries:
+            try:
+                buffer.seek(0)
+                buffer.truncate()
+
+                headers = self._conditional_headers(etag_path, conditional)
+
+                session = await self._get_session()
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        yield self._not_modified_progress(url)
+                        return
+                    if response.status != 200:
+                        raise AsyncYTBase(
+                            f"Failed to download {url}: {response.status}"
+                        )
+                    total = int(response.headers.get("Content-Length", 0))
+                    async for progress in self._stream_body(
+                        response, buffer.write, 0, total
+                    ):
+                        yield progress
+                    downloaded = buffer.tell()
+
+                # Verify size (only if we know the expected size)
+                if total > 0 and downloaded != total:
+                    raise AsyncYTBase(
+                        f"Incomplete download for {url}: expected {total}, got {downloaded}"
+                    )
+                self._save_etag(etag_path, response)
+                buffer.seek(0)
+                return
+            except Exception as e:
+                attempt += 1
+                await self._wait_before_retry(url, attempt, e)
+
+        raise AsyncYTBase(f"Failed to download {url} after {max_retries} attempts.")
+
+    @staticmethod
+    async def _stream_body(
+        response: aiohttp.ClientResponse,
+        write: Callable[[bytearray], Any],
+        downloaded: int,
+        total: int,
+        digest: Optional["hashlib._Hash"] = None,
+    ) -> AsyncGenerator[DownloadFileProgress, Any]:
+        """
+        Stream a response body into *write*, yielding progress per chunk.
+
+        Chunks are collected and passed to *write* from a worker thread once
+        per ``_WRITE_BUFFER`` bytes, so file and buffer writes never block the
+        event loop.
+
+        :param response: Response whose body is streamed.
+        :type response: aiohttp.ClientResponse
+        :param write: Blocking callable that stores a block of bytes.
+        :type write: Callable[[bytearray], Any]
+        :param downloaded: Bytes already present (when resuming).
+        :type downloaded: int
+        :param total: Expected total size, or ``0`` if unknown.
+        :type total: int
+        :param digest: Hash object updated with every chunk.
+        :return: Async generator yielding DownloadFileProgress objects.
+        :rtype: AsyncGenerator[DownloadFileProgress, Any]
+        """
+        pending = bytearray()
+        async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+            pending += chunk
+            if len(pending) >= _WRITE_BUFFER:
+                await asyncio.to_thread(write, pending)
+                pending.clear()
+            if digest is not None:
+                digest.update(chunk)
+            downloaded += len(chunk)
+
+            # Calculate progress
+            if total > 0:
+                percent = (downloaded / total) * 100
+            else:
+                percent = 0
+
+            yield DownloadFileProgress(
+                status=ProgressStatus.DOWNLOADING,
+                downloaded_bytes=downloaded,
+                total_bytes=total,
+                percentage=percent,
+            )
+        if pending:
+            await asyncio.to_thread(write, pending)
+
+    @staticmethod
+    async def _wait_before_retry(
+        url: str, attempt: int, error: Exception, what: str = "failed"
+    ) -> None:
+        """Log a failed download attempt and sleep with exponential backoff."""
+        wait = min(2**attempt, 60)  # Cap wait time at 60 seconds
+        logger.warning(
+            f"Download attempt {attempt} {what} for {url}: {error}. Retrying in {wait}s..."
+        )
+        await asyncio.sleep(wait)
+
+    @staticmethod
+    def _conditional_headers(
+        etag_path: Optional[Path], conditional: bool
+    ) -> Dict[str, str]:
+        """Build ``If-None-Match`` headers from a saved ETag, if any."""
+        if conditional and etag_path is not None and etag_path.exists():
+            etag = etag_path.read_text().strip()
+            if etag:
+                return {"If-None-Match": etag}
+        return {}
+
+    @staticmethod
+    def _save_etag(etag_path: Optional[Path], response: aiohttp.ClientResponse) -> None:
+        """Persist the response ETag next to the downloaded file."""
+        if etag_path is None:
+            return
+        etag = response.headers.get("ETag")
+        if etag:
+            etag_path.write_text(etag)
+        else:
+            etag_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _not_modified_progress(url: str) -> DownloadFileProgress:
+        """Progress reported when the server answers ``304 Not Modified``."""
+        logger.info(f"{url} is up to date (304 Not Modified)")
+        return DownloadFileProgress(
+            status=ProgressStatus.COMPLETED,
+            downloaded_bytes=0,
+            total_bytes=0,
+            percentage=100,
+        )
+
     async def _download_file(
-        self, url: str, filepath: Path, max_retries: int = 5
+        self,
+        url: str,
+        filepath: Path,
+        max_retries: int = 5,
+        etag_path: Optional[Path] = None,
+        conditional: bool = False,
+        digest_path: Optional[Path] = None,
     ) -> AsyncGenerator[DownloadFileProgress, Any]:
         """
         Download a file asynchronously with retries, timeout, resume support, and file size verification.
 
+        With *conditional*, the ETag saved in *etag_path* is sent as
+        ``If-None-Match``; a ``304 Not Modified`` leaves *filepath* untouched.
+        The SHA-256 is computed while streaming and written to *digest_path*.
+
         :param url: URL to download from.
         :type url: str
         :param filepath: Path to save the file.
         :type filepath: Path
         :param max_retries: Maximum number of retries.
         :type max_retries: int
+        :param etag_path: Sidecar file the response ETag is saved to.
+        :type etag_path: Optional[Path]
+        :param conditional: Send the saved ETag as ``If-None-Match``.
+        :type conditional: bool
+        :param digest_path: Sidecar file the SHA-256 hex digest is saved to.
+        :type digest_path: Optional[Path]
         :return: Async generator yielding DownloadFileProgress objects.
         :rtype: AsyncGenerator[DownloadFileProgress, Any]
         :raises AsyncYTBase: If download fails after max_retries.
         """
         temp_filepath = filepath.with_suffix(filepath.suffix + ".part")
         attempt = 0
-        backoff = 2
         while attempt < max_retries:
             try:
                 resume_pos = 0
@@ -301,100 +702,112 @@ class BinaryManager:
                 headers = {}
                 if resume_pos > 0:
                     headers["Range"] = f"bytes={resume_pos}-"
-
-                timeout_obj = aiohttp.ClientTimeout(
-                    total=None, sock_connect=30, sock_read=300
-                )
-                async with aiohttp.ClientSession(timeout=timeout_obj) as session:
-                    async with session.get(url, headers=headers) as response:
-                        if response.status in (200, 206):
-                            mode = (
-                                "ab"
-                                if resume_pos > 0 and response.status == 206
-                                else "wb"
+                else:
+                    headers = self._conditional_headers(etag_path, conditional)
+
+                session = await self._get_session()
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304:
+                        yield self._not_modified_progress(url)
+                        return
+                    if response.status in (200, 206):
+                        mode = (
+                            "ab" if resume_pos > 0 and response.status == 206 else "wb"
+                        )
+                        # Resumed bytes are hashed from disk, the rest as it streams.
+                        digest = (
+                            await asyncio.to_thread(self._file_sha256, temp_filepath)
+                            if mode == "ab"
+                            else hashlib.sha256()
+                        )
+                        flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+                        flags |= os.O_APPEND if mode == "ab" else os.O_TRUNC
+                        fd = os.open(temp_filepath, flags, 0o644)
+                        try:
+                            total = (
+                                int(response.headers.get("Content-Length", 0))
+                                + resume_pos
+                                if response.status == 206
+                                else int(response.headers.get("Content-Length", 0))
                             )
-                            async with aiofiles.open(temp_filepath, mode) as f:
-                                downloaded = resume_pos
-                                total = (
-                                    int(response.headers.get("Content-Length", 0))
-                                    + resume_pos
-                                    if response.status == 206
-                                    else int(response.headers.get("Content-Length", 0))
-                                )
-                                chunk_size = 4096
-
-                                async for chunk in response.content.iter_chunked(
-                                    chunk_size
-                                ):
-                                    await f.write(chunk)
-                                    downloaded += len(chunk)
-
-                                    # Calculate progress
-                                    if total > 0:
-                                        percent = (downloaded / total) * 100
-                                    else:
-                                        percent = 0
-
-                                    yield DownloadFileProgress(
-                                        status=ProgressStatus.DOWNLOADING,
-                                        downloaded_bytes=downloaded,
-                                        total_bytes=total,
-                                        percentage=percent,
-                                    )
-
-                            # Verify file size (only if we know the expected size)
-                            if total > 0 and temp_filepath.stat().st_size != total:
-                                raise AsyncYTBase(
-                                    f"Incomplete download for {filepath.name}: expected {total}, got {temp_filepath.stat().st_size}"
-                                )
-                            temp_filepath.rename(filepath)
-                            return
-                        else:
+                            async for progress in self._stream_body(
+                                response,
+                                functools.partial(_write_all, fd),
+                                resume_pos,
+                                total,
+                                digest,
+                            ):
+                                yield progress
+                        finally:
+                            os.close(fd)
+
+                        # Verify file size (only if we know the expected size)
+                        if total > 0 and temp_filepath.stat().st_size != total:
                             raise AsyncYTBase(
-                                f"Failed to download {url}: {response.status}"
+                                f"Incomplete download for {filepath.name}: expected {total}, got {temp_filepath.stat().st_size}"
                             )
+                        temp_filepath.replace(filepath)
+                        self._save_etag(etag_path, response)
+                        if digest_path is not None:
+                            digest_path.write_text(digest.hexdigest())
+                        return
+                    else:
+                        raise AsyncYTBase(
+                            f"Failed to download {url}: {response.status}"
+                        )
             except asyncio.TimeoutError as e:
                 attempt += 1
-                wait = min(backoff**attempt, 60)  # Cap wait time at 60 seconds
-                logger.warning(
-                    f"Download attempt {attempt} timed out for {url}: {e}. Retrying in {wait}s..."
-                )
-                await asyncio.sleep(wait)
+                await self._wait_before_retry(url, attempt, e, "timed out")
 
             except Exception as e:
                 attempt += 1
-                wait = min(backoff**attempt, 60)  # Cap wait time at 60 seconds
-                logger.warning(
-                    f"Download attempt {attempt} failed for {url}: {e}. Retrying in {wait}s..."
-                )
-                await asyncio.sleep(wait)
+                await self._wait_before_retry(url, attempt, e)
 
         raise AsyncYTBase(f"Failed to download {url} after {max_retries} attempts.")
 
-    async def health_check(self) -> HealthResponse:
+    async def health_check(self, force: bool = False) -> HealthResponse:
         """
         Perform a health check on the required binaries (yt-dlp and ffmpeg).
 
+        Results are cached for 30 seconds (and dropped on ``setup_binaries``),
+        so frequent liveness checks don't spawn new processes every call.
+
+        :param force: Ignore the cached result and probe the binaries again.
+        :type force: bool
         :return: HealthResponse object with health status and binary availability.
         :rtype: HealthResponse
         :raises Exception: If an unexpected error occurs during the health check process.
         """
+        if not force and self._health_cache is not None:
+            checked_at, cached = self._health_cache
+            if time.monotonic() - checked_at < _HEALTH_TTL:
+                return cached.model_copy()
 
         try:
-            # Check yt-dlp
+            # Check yt-dlp (re-run only when the binary changed on disk)
             ytdlp_available = False
+            ytdlp_version: Optional[str] = None
             if self.ytdlp_path and self.ytdlp_path.exists():
-                try:
-                    process = await asyncio.create_subprocess_exec(
-                        str(self.ytdlp_path),
-                        "--version",
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                    )
-                    await process.communicate()
-                    ytdlp_available = process.returncode == 0
-                except Exception:
-                    ytdlp_available = False
+                mtime = self.ytdlp_path.stat().st_mtime
+                if self._ytdlp_version and self._ytdlp_version[0] == mtime:
+                    ytdlp_available = True
+                else:
+                    try:
+                        # Only stdout is needed, for the reported version.
+                        process = await asyncio.create_subprocess_exec(
+                            str(self.ytdlp_path),
+                            "--version",
+                            stdout=asyncio.subprocess.PIPE,
+                            stderr=asyncio.subprocess.DEVNULL,
+                        )
+                        stdout, _ = await process.communicate()
+                        ytdlp_available = process.returncode == 0
+                        if ytdlp_available:
+                            self._ytdlp_version = (mtime, stdout.decode().strip())
+                    except Exception:
+                        ytdlp_available = False
+                if ytdlp_available and self._ytdlp_version:
+                    ytdlp_version = self._ytdlp_version[1]
 
             # Check ffmpeg
             ffmpeg_available = False
@@ -405,26 +818,29 @@ class BinaryManager:
                         if self.ffmpeg_path != "ffmpeg"
                         else "ffmpeg"
                     )
+                    # Liveness only — discard the banner instead of piping it.
                     process = await asyncio.create_subprocess_exec(
                         ffmpeg_cmd,
                         "-version",
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.DEVNULL,
                     )
-                    await process.communicate()
-                    ffmpeg_available = process.returncode == 0
+                    ffmpeg_available = await process.wait() == 0
                 except Exception:
                     ffmpeg_available = False
 
             status = "healthy" if (ytdlp_available and ffmpeg_available) else "degraded"
 
-            return HealthResponse(
+            response = HealthResponse(
                 status=status,
                 yt_dlp_available=ytdlp_available,
                 ffmpeg_available=ffmpeg_available,
                 binaries_path=str(self.bin_dir),
                 version=__version__,
+                yt_dlp_version=ytdlp_version,
             )
+            self._health_cache = (time.monotonic(), response)
+            return response.model_copy()
 
         except Exception as e:
             return HealthResponse(
@@ -434,260 +850,3 @@ class BinaryManager:
                 error=str(e),
                 version=__version__,
             )
-
-    def _get_format_selector(self, quality: "Quality") -> str:
-        """Get yt-dlp format selector for quality. Use flexible format selection to let FFmpeg handle conversion."""
-        if quality == Quality.BEST:
-            return "bestvideo+bestaudio/best"
-        elif quality == Quality.WORST:
-            return "worst"
-        elif quality == Quality.AUDIO_ONLY:
-            return "bestaudio/best"
-        elif quality == Quality.VIDEO_ONLY:
-            return "bestvideo/best"
-        else:
-            height = quality.value.replace("p", "")
-            return f"bestvideo[height<={height}]+bestaudio/best[height<={height}]"
-
-    def _build_download_command(self, url: str, config: "DownloadConfig") -> List[str]:
-        """
-        Build the yt-dlp command based on configuration.
-
-        :param url: URL to download.
-        :type url: str
-        :param config: Download configuration.
-        :type config: DownloadConfig
-        :return: List of command arguments for yt-dlp.
-        :rtype: List[str]
-        """
-
-        cmd = [str(self.ytdlp_path)]
-
-        # Basic options
-        cmd.extend(
-            [
-                "--no-warnings",
-                "--progress",
-                "--newline",
-                "--no-playlist",
-            ]
-        )
-
-        # Quality and format
-        selected_quality = (
-            Quality.AUDIO_ONLY if config.extract_audio else Quality(config.quality)
-        )
-        cmd.extend(["-f", self._get_format_selector(selected_quality)])
-
-        if config.extract_audio:
-            cmd.extend(["--extract-audio", "--audio-format", "mp3"])
-
-        # Output template - use safe template that preserves Unicode
-        if config.custom_filename:
-            cmd.extend(["-o", config.custom_filename])
-        else:
-            # Use sanitized version but keep Unicode
-            cmd.extend(["-o", "%(title).200B.%(ext)s"])
-
-        # Thumbnail handling
-        if config.embed_thumbnail or config.write_thumbnail:
-            cmd.extend(["--write-thumbnail", "--convert-thumbnails", "jpg"])
-        if config.embed_thumbnail:
-            cmd.append("--embed-thumbnail")
-
-        # Metadata and subtitles
-        if config.write_subs:
-            cmd.extend(["--write-subs", "--sub-lang", config.subtitle_lang])
-        if config.embed_subs:
-            cmd.append("--embed-subs")
-        if config.embed_metadata:
-            cmd.append("--add-metadata")
-        if config.write_info_json:
-            cmd.append("--write-info-json")
-        if config.write_live_chat:
-            cmd.append("--write-live-chat")
-
-        # Network options
-        if config.cookies_file:
-            cmd.extend(["--cookies", str(Path(config.cookies_file).resolve())])
-        if config.proxy:
-            cmd.extend(["--proxy", config.proxy])
-        if config.rate_limit:
-            cmd.extend(["--limit-rate", config.rate_limit])
-
-        # Retry options
-        cmd.extend(
-            [
-                "--retries",
-                str(config.retries),
-                "--fragment-retries",
-                str(config.fragment_retries),
-            ]
-        )
-
-        # FFmpeg location
-        if self.ffmpeg_path:
-            cmd.extend(["--ffmpeg-location", str(self.ffmpeg_path)])
-
-        # Progress template for parsing
-        cmd.extend(
-            [
-                "--progress-template",
-                "download:PROGRESS|%(progress._percent_str)s|%(progress._downloaded_bytes_str)s|%(progress._total_bytes_str)s|%(progress._speed_str)s|%(progress._eta_str)s",
-            ]
-        )
-        cmd.append("--restrict-filenames")
-        cmd.extend(["--print", "after_move:filepath"])
-
-        # Output metadata as JSON for reliable parsing
-        # cmd.append("--dump-single-json")
-
-        # Custom options
-        for key, value in config.custom_options.items():
-            if isinstance(value, bool) and value:
-                cmd.append(f"--{key}")
-            elif not isinstance(value, bool):
-                cmd.extend([f"--{key}", str(value)])
-
-        cmd.append(url)
-
-        return cmd
-
-    async def _read_process_output(self, process):
-        """
-        Read process output line by line as UTF-8 (with replacement for bad chars).
-
-        :param process: The process to read output from.
-        :type process: asyncio.subprocess.Process
-        :return: Async generator yielding lines of output.
-        """
-        assert process.stdout is not None, "Process must have stdout=PIPE"
-
-        try:
-            while True:
-                line = await process.stdout.readline()
-                if not line:
-                    break
-                data = line.decode("utf-8", errors="replace").rstrip()
-                yield data
-
-        except ValueError as e:
-            if "chunk is longer than limit" in str(e):
-                # yt-dlp --dump-single-json workaround
-                data = await process.stdout.read()
-                data = data.decode("utf-8", errors="replace").rstrip()
-                yield data
-            else:
-                raise
-
-    def _parse_progress(self, line: str, progress: DownloadProgress) -> None:
-        """
-        Parse progress information from yt-dlp output.
-
-        :param line: Output line from yt-dlp.
-        :type line: str
-        :param progress: DownloadProgress object to update.
-        :type progress: DownloadProgress
-        :return: None
-        """
-        line = line.strip()
-        if "Destination:" in line:
-            # Extract title
-            progress.title = Path(line.split("Destination: ")[1]).stem
-            return
-
-        if line.startswith("PROGRESS|"):
-            try:
-                # Split the custom format: PROGRESS|percentage|downloaded|total|speed|eta
-                parts = line.split("|")
-                if len(parts) >= 6:
-                    percentage_str = parts[1].replace("%", "").strip()
-                    downloaded_str = parts[2].strip()
-                    total_str = parts[3].strip()
-                    speed_str = parts[4].strip()
-                    eta_str = parts[5].strip()
-
-                    # Parse percentage
-                    if percentage_str and percentage_str != "N/A":
-                        progress.percentage = float(percentage_str)
-
-                    # Parse downloaded bytes
-                    if downloaded_str and downloaded_str != "N/A":
-                        progress.downloaded_bytes = self._parse_size(downloaded_str)
-
-                    # Parse total bytes
-                    if total_str and total_str != "N/A":
-                        progress.total_bytes = self._parse_size(total_str)
-
-                    # Parse speed
-                    if speed_str and speed_str != "N/A":
-                        progress.speed = speed_str
-
-                    # Parse ETA
-                    if eta_str and eta_str != "N/A":
-                        progress.eta = self._parse_time(eta_str)
-
-                    return
-            except (ValueError, IndexError) as e:
-                pass
-
-    def _parse_size(self, size_str: str) -> int:
-        """
-        Parse size string (e.g., '10.5MiB', '1.2GB') to bytes.
-
-        :param size_str: Size string to parse.
-        :type size_str: str
-        :return: Size in bytes.
-        :rtype: int
-        """
-        if not size_str:
-            return 0
-
-        size_str = size_str.strip().replace("~", "")
-
-        # Handle different size units
-        multipliers = {
-            "B": 1,
-            "KiB": 1024,
-            "KB": 1000,
-            "MiB": 1024**2,
-            "MB": 1000**2,
-            "GiB": 1024**3,
-            "GB": 1000**3,
-            "TiB": 1024**4,
-            "TB": 1000**4,
-        }
-
-        for unit, multiplier in multipliers.items():
-            if size_str.endswith(unit):
-                try:
-                    number = float(size_str[: -len(unit)])
-                    return int(number * multiplier)
-                except ValueError:
-                    return 0
-
-        # If no unit, assume bytes
-        try:
-            return int(float(size_str))
-        except ValueError:
-            return 0
-
-    def _parse_time(self, time_str: str) -> int:
-        """
-        Parse time string to seconds.
-
-        :param time_str: Time string to parse.
-        :type time_str: str
-        :return: Time in seconds.
-        :rtype: int
-        """
-        try:
-            parts = time_str.split(":")
-            if len(parts) == 2:
-                return int(parts[0]) * 60 + int(parts[1])
-            elif len(parts) == 3:
-                return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-            else:
-                return int(time_str)
-        except ValueError:
-            return 0
@@ -7,8 +7,10 @@ Builds yt-dlp CLI commands from a DownloadConfig.
 from __future__ import annotations
 
 import logging
+import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Tuple
 
 from asyncyt.basemodels import VideoFormat
 
@@ -19,7 +21,13 @@ from .enums import AudioFormat, Quality
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["build_download_command"]
+__all__ = ["build_download_command", "build_playlist_command"]
+
+# Most recently used base commands (everything but the output template and
+# the URL) with the index the template goes at, keyed by the inputs that
+# shape them.  Bounded so one-off configs don't accumulate.
+_BASE_COMMANDS: "OrderedDict[tuple, Tuple[Tuple[str, ...], int]]" = OrderedDict()
+_BASE_COMMANDS_MAX = 64
 
 _QUALITY_FORMAT: dict[str, str] = {
     Quality.BEST: "bestvideo*+bestaudio/best",
@@ -99,6 +107,7 @@ def build_download_command(
     ffmpeg_path: str,
     url: str,
     config: "DownloadConfig",
+    output_subdir: str | None = None,
 ) -> List[str]:
     """
     Build a complete yt-dlp CLI command.
@@ -107,10 +116,81 @@ def build_download_command(
     ``-progress pipe:1`` output lands on yt-dlp's stdout and can be parsed
     in real-time by AsyncYT's line reader.
 
+    Everything except the output template and the URL is cached per config,
+    so downloading many URLs with the same :class:`DownloadConfig` only
+    builds the options once, whatever ``output_path`` each call uses.
+
     :param ytdlp_path: Path to yt-dlp binary.
     :param ffmpeg_path: Path to ffmpeg binary.
     :param url: Target URL.
     :param config: DownloadConfig instance.
+    :param output_subdir: Optional yt-dlp template for a sub-directory of
+                          ``config.output_path`` (e.g. ``"%(playlist_index)s"``).
+    """
+    # The key covers everything the cached options depend on.  output_path
+    # and custom_filename only shape the -o template, which download() points
+    # at a fresh temp dir every call, so they are left out and the template
+    # is spliced in below.  The working directory is included because a
+    # relative archive_file is resolved against it.
+    key = (
+        ytdlp_path,
+        ffmpeg_path,
+        os.getcwd(),
+        config.model_dump_json(exclude={"output_path", "custom_filename"}),
+    )
+    cached = _BASE_COMMANDS.get(key)
+    if cached is None:
+        cmd, output_at = _build_base_command(ytdlp_path, ffmpeg_path, config)
+        cached = (tuple(cmd), output_at)
+        _BASE_COMMANDS[key] = cached
+        if len(_BASE_COMMANDS) > _BASE_COMMANDS_MAX:
+            _BASE_COMMANDS.popitem(last=False)
+    else:
+        _BASE_COMMANDS.move_to_end(key)
+    base, output_at = cached
+
+    # 16. URL (always last)
+    cmd = [
+        *base[:output_at],
+        *_output_args(config, output_subdir),
+        *base[output_at:],
+        "--",
+        url,
+    ]
+
+    logger.debug("yt-dlp command: %s", " ".join(cmd))
+    return cmd
+
+
+def _output_args(config: "DownloadConfig", output_subdir: str | None) -> List[str]:
+    """
+    Build the ``-o`` output template arguments.
+
+    Runs on every call, cache hit or not, so it sticks to ``os.path`` string
+    operations: ``Path.resolve()`` stats every path component and cost more
+    than building the cached options did.
+    """
+    output_path = os.path.abspath(config.output_path)
+    if output_subdir:
+        output_path = os.path.join(output_path, output_subdir)
+    if config.custom_filename:
+        return ["-o", os.path.join(output_path, config.custom_filename)]
+    return [
+        "--windows-filenames",
+        "-o",
+        os.path.join(output_path, "%(title)s.%(ext)s"),
+    ]
+
+
+def _build_base_command(
+    ytdlp_path: str,
+    ffmpeg_path: str,
+    config: "DownloadConfig",
+) -> Tuple[List[str], int]:
+    """
+    Build every yt-dlp argument except the output template and the URL.
+
+    :return: The arguments and the index the output template belongs at.
     """
     config = config.model_copy(deep=True)
 
@@ -122,14 +202,8 @@ def build_download_command(
     # 2. Format / quality
     cmd += ["-f", _format_selector(config)]
 
-    # 3. Output template
-    output_path = str(Path(config.output_path).resolve())
-    if config.custom_filename:
-        template = str(Path(output_path) / config.custom_filename)
-    else:
-        cmd.append("--windows-filenames")
-        template = str(Path(output_path) / "%(title)s.%(ext)s")
-    cmd += ["-o", template]
+    # 3. Output template — spliced in here by build_download_command()
+    output_at = len(cmd)
 
     # 4. Network / reliability
     if config.proxy:
@@ -293,6 +367,9 @@ def build_download_command(
         cmd += ["--write-info-json"]
     if config.write_live_chat:
         cmd += ["--write-subs", "--sub-format", "json3"]
+    if config.archive_file:
+        # yt-dlp runs inside a temp dir, so relative paths must be resolved here.
+        cmd += ["--download-archive", str(Path(config.archive_file).resolve())]
 
     # 13. Overwrite behaviour
     overwrite = getattr(encoding, "overwrite", False) if encoding else False
@@ -312,9 +389,47 @@ def build_download_command(
         elif value is not False:
             cmd += [flag, str(value)]
 
-    # 16. URL (always last)
-    cmd.append("--")
-    cmd.append(url)
+    return cmd, output_at
 
-    logger.debug("yt-dlp command: %s", " ".join(cmd))
+
+def build_playlist_command(
+    ytdlp_path: str,
+    ffmpeg_path: str,
+    url: str,
+    config: "DownloadConfig",
+    playlist_items: List[int],
+    ignore_errors: bool = True,
+) -> List[str]:
+    """
+    Build one yt-dlp command that downloads several items of a playlist.
+
+    Every item is written to its own ``<output_path>/<playlist_index>/``
+    directory so the caller can map output files back to playlist entries.
+
+    :param ytdlp_path: Path to yt-dlp binary.
+    :param ffmpeg_path: Path to ffmpeg binary.
+    :param url: Playlist URL.
+    :param config: DownloadConfig applied to every item.
+    :param playlist_items: 1-based playlist indices to download.
+    :param ignore_errors: Keep going when an item fails instead of aborting.
+    """
+    cmd = build_download_command(
+        ytdlp_path=ytdlp_path,
+        ffmpeg_path=ffmpeg_path,
+        url=url,
+        config=config,
+        output_subdir="%(playlist_index)s",
+    )
+
+    # Insert before the trailing "--", url
+    playlist_args = [
+        "--yes-playlist",
+        "--playlist-items",
+        ",".join(str(i) for i in playlist_items),
+    ]
+    if ignore_errors:
+        playlist_args.append("--ignore-errors")
+    cmd[-2:-2] = playlist_args
+
+    logger.debug("yt-dlp playlist command: %s", " ".join(cmd))
     return cmd
@@ -15,10 +15,22 @@ import re
 import shutil
 import signal
 import tempfile
+import time
 import warnings
-from json import loads
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Union, overload
+from contextlib import aclosing
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+    overload,
+)
 from collections.abc import Callable as CallableABC
 
 from .basemodels import (
@@ -37,10 +49,11 @@ from .basemodels import (
     SearchResponse,
     VideoInfo,
 )
-from .builder import build_download_command
+from .builder import build_download_command, build_playlist_command
 from .enums import PlaylistStatus, ProgressStatus
 from .exceptions import (
     AsyncYTBase,
+    DownloadAlreadyArchivedError,
     DownloadAlreadyExistsError,
     DownloadGotCanceledError,
     DownloadNotFoundError,
@@ -57,15 +70,27 @@ from .utils import (
     get_id,
     get_unique_filename,
     get_unique_path,
+    read_download_archive,
 )
 from .binaries import BinaryManager
 
+# orjson is an optional speedup for the large JSON yt-dlp prints; both
+# accept the raw bytes read from the pipe.
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 logger = logging.getLogger(__name__)
 
 __all__ = ["AsyncYT"]
 
 _IS_WINDOWS = platform.system().lower() == "windows"
 
+# A single --dump-json line can run to hundreds of KiB; asyncio's default
+# 64 KiB StreamReader limit would make readline() fail on it.
+_JSON_LINE_LIMIT = 1 << 25
+
 
 # [download]  45.3% of ~  50.00MiB at    3.20MiB/s ETA 00:08
 _RE_DOWNLOAD = re.compile(
@@ -76,15 +101,75 @@ _RE_DOWNLOAD = re.compile(
     r"(?:\s+ETA\s+(?P<eta>[\d:]+))?"
 )
 
-_RE_MERGER = re.compile(r"\[Merger\]", re.IGNORECASE)
-_RE_CONVERTOR = re.compile(r"\[VideoConvertor\]|\[ExtractAudio\]", re.IGNORECASE)
-_RE_REMUXER = re.compile(r"\[VideoRemuxer\]", re.IGNORECASE)
-_RE_DESTINATION = re.compile(
-    r"(?:\[download\] Destination:|Merging formats into)\s+(.+)"
+# Classifies a yt-dlp line by its leading [tag] in a single anchored match;
+# ``lastgroup`` names the phase (merger / convertor / remuxer / download).
+_RE_LINE_KIND = re.compile(
+    r"\[(?:"
+    r"(?P<merger>Merger)"
+    r"|(?P<convertor>VideoConvertor|ExtractAudio)"
+    r"|(?P<remuxer>VideoRemuxer)"
+    r"|(?P<download>download)"
+    r")\]",
+    re.IGNORECASE,
+)
+# [download] Destination: /tmp/x/Title.f137.mp4
+# [Merger] Merging formats into "/tmp/x/Title.mp4"
+_DESTINATION_MARKERS = ("[download] Destination: ", "Merging formats into ")
+# [download] /tmp/x/Title.mp4 has already been downloaded
+_DONE_SUFFIX = " has already been downloaded"
+_RE_DONE = re.compile(r"^\[download\] (.+?) has already been downloaded")
+# [download] Title has already been recorded in the archive
+_ARCHIVED_SUFFIX = " has already been recorded in the archive"
+# ERROR: [youtube] dQw4w9WgXcQ: Video unavailable
+_RE_ITEM_ERROR = re.compile(r"^ERROR:\s+\[[^\]]+\]\s+([^\s:]+):")
+# Files yt-dlp leaves behind mid-download: Title.mp4.part, Title.mp4.ytdl
+# and fragment files such as Title.mp4.part-Frag3
+_RE_PARTIAL_FILE = re.compile(r"\.(?:part|ytdl)$|\.part-Frag\d+")
+
+# 50.00MiB / ~1.2GB / 512B — the unit is optional and defaults to bytes
+_RE_SIZE = re.compile(r"^\s*~?\s*([\d.]+)\s*((?:[KMGT]i?)?B)?\s*$")
+_SIZE_MULTIPLIERS = MappingProxyType(
+    {
+        "B": 1,
+        "KiB": 1024,
+        "KB": 1000,
+        "MiB": 1024**2,
+        "MB": 1000**2,
+        "GiB": 1024**3,
+        "GB": 1000**3,
+        "TiB": 1024**4,
+        "TB": 1000**4,
+    }
 )
 
-# FFmpeg -progress key=value line (e.g. "out_time=00:00:05.123456")
-_RE_FFMPEG_KV = re.compile(r"^(?P<key>[a-zA-Z_]+)=(?P<value>.+)$")
+
+def _split_ffmpeg_kv(line: str) -> Optional[tuple[str, str]]:
+    """
+    Split an FFmpeg ``-progress`` line (``out_time=00:00:05.123456``).
+
+    Runs on every output line, so it sticks to ``str.partition`` and
+    ``str.isidentifier`` rather than a regex, and the caller reuses the
+    pieces instead of parsing the line a second time.
+
+    :return: ``(key, stripped value)``, or None if *line* isn't ``key=value``.
+    """
+    key, sep, value = line.partition("=")
+    if sep and value and key.isidentifier():
+        return key, value.strip()
+    return None
+
+
+def _destination(line: str) -> Optional[str]:
+    """Output path announced by *line*, or None if it names no file."""
+    for marker in _DESTINATION_MARKERS:
+        _, sep, tail = line.partition(marker)
+        if sep:
+            return tail.strip().strip('"')
+    if line.endswith(_DONE_SUFFIX):
+        m = _RE_DONE.match(line)
+        if m:
+            return m.group(1)
+    return None
 
 
 def _parse_eta(eta_str: str) -> int:
@@ -113,6 +198,18 @@ def _out_time_to_seconds(t: str) -> float:
         return 0.0
 
 
+def _parse_size(size_str: str) -> int:
+    """Convert a yt-dlp size string (``10.5MiB``, ``~1.2GB``) to bytes; 0 if unparsable."""
+    m = _RE_SIZE.match(size_str)
+    if m is None:
+        return 0
+    try:
+        number = float(m.group(1))
+    except ValueError:
+        return 0
+    return int(number * _SIZE_MULTIPLIERS[m.group(2) or "B"])
+
+
 def _bytes_to_human(n: int) -> str:
     for unit in ("B", "KiB", "MiB", "GiB"):
         if n < 1024:
@@ -135,18 +232,11 @@ class _FfmpegProgressParser:
         self.total_duration = total_duration
         self._block: Dict[str, str] = {}
 
-    def feed(self, line: str) -> bool:
+    def feed(self, key: str, value: str) -> bool:
         """
-        Feed one line.  Returns True if ``progress`` was updated.
-        ``line`` should already be stripped.
+        Feed one ``key=value`` pair (see :func:`_split_ffmpeg_kv`).
+        Returns True if ``progress`` was updated.
         """
-        m = _RE_FFMPEG_KV.match(line)
-        if not m:
-            return False
-
-        key = m.group("key")
-        value = m.group("value").strip()
-
         if key == "progress":
             changed = self._flush()
             self._block = {}
@@ -239,50 +329,211 @@ def _update_download_progress(
 
     # --- FFmpeg -progress pipe:1 key=value lines ---
     # These are interleaved with yt-dlp output when using --external-downloader ffmpeg
-    if _RE_FFMPEG_KV.match(stripped):
-        return ffmpeg_parser.feed(stripped)
+    kv = _split_ffmpeg_kv(stripped)
+    if kv is not None:
+        return ffmpeg_parser.feed(*kv)
+
+    kind_match = _RE_LINE_KIND.match(stripped)
+    if kind_match is None:
+        return False
+    kind = kind_match.lastgroup
 
     # --- Phase change markers ---
-    if _RE_MERGER.search(line):
+    if kind == "merger":
         if progress.status != ProgressStatus.MERGING:
             progress.status = ProgressStatus.MERGING
             return True
         return False
 
-    if _RE_CONVERTOR.search(line):
+    if kind == "convertor":
         if progress.status != ProgressStatus.ENCODING:
             progress.status = ProgressStatus.ENCODING
             progress.encoding_percentage = 0.0
             return True
         return False
 
-    if _RE_REMUXER.search(line):
+    if kind == "remuxer":
         if progress.status != ProgressStatus.REMUXING:
             progress.status = ProgressStatus.REMUXING
             return True
         return False
 
-    # --- Title from destination line ---
-    dm = _RE_DESTINATION.search(line)
-    if dm:
-        progress.title = Path(dm.group(1).strip()).stem
-        return False
-
-    # --- yt-dlp download progress line ---
-    m = _RE_DOWNLOAD.search(line)
+    # --- yt-dlp download progress line (by far the most common) ---
+    m = _RE_DOWNLOAD.match(stripped)
     if m:
-        old_pct = progress.percentage
-        progress.percentage = min(float(m.group("pct")), 100.0)
-        if m.group("speed"):
-            progress.speed = m.group("speed").strip()
-        if m.group("eta"):
-            progress.eta = _parse_eta(m.group("eta"))
+        pct = min(float(m.group("pct")), 100.0)
+        if pct == progress.percentage and progress.status == ProgressStatus.DOWNLOADING:
+            # Nothing the callback fires on changed — skip the model writes.
+            return False
+        progress.percentage = pct
+        total, speed, eta = m.group("total", "speed", "eta")
+        if total:
+            progress.total_bytes = _parse_size(total)
+            progress.downloaded_bytes = int(progress.total_bytes * pct / 100)
+        if speed:
+            progress.speed = speed.strip()
+        if eta:
+            progress.eta = _parse_eta(eta)
         progress.status = ProgressStatus.DOWNLOADING
-        return progress.percentage != old_pct
+        return True
+
+    # --- Title from destination line ---
+    dest = _destination(stripped)
+    if dest is not None:
+        progress.title = Path(dest).stem
 
     return False
 
 
+class _CallbackPump:
+    """
+    Deliver progress callbacks from a background task.
+
+    :meth:`notify` never awaits.  While the callback is still busy with an
+    earlier update, further updates collapse into a single pending call, so
+    a slow callback can't stall reading yt-dlp's output and nothing queues
+    up behind it.  The callback always sees the latest progress state.
+    """
+
+    def __init__(self, callback: Callable[..., Any], *args: Any):
+        self._callback = callback
+        self._args = args
+        self._pending = False
+        self._closed = False
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            if self._pending:
+                self._pending = False
+                await call_callback(self._callback, *self._args)
+            if self._closed and not self._pending:
+                return
+
+    def notify(self) -> None:
+        """Schedule a callback with the current state (re-raises callback errors)."""
+        if self._task.done():
+            self._task.result()
+        self._pending = True
+        self._wake.set()
+
+    async def aclose(self) -> None:
+        """Deliver a pending update, then stop the background task."""
+        self._closed = True
+        self._wake.set()
+        await self._task
+
+    def cancel(self) -> None:
+        """Stop the background task, dropping any pending update."""
+        self._task.cancel()
+
+
+class _EntrySelector:
+    """
+    Apply the :class:`PlaylistConfig` entry filters one entry at a time.
+
+    Entries must be fed in playlist order.  Because a decision never depends
+    on later entries, downloads can start while the playlist is still being
+    enumerated.  Explicit ``video_indices`` / ``video_ids`` take precedence
+    over ``start_index`` / ``end_index`` / ``max_videos``.  Entries whose ID
+    is in *archived* are set aside in :attr:`skipped` and don't count
+    towards ``max_videos``.
+    """
+
+    def __init__(self, config: PlaylistConfig, archived: Optional[set[str]] = None):
+        self._positions = set(config.video_indices or ())
+        self._ids = set(config.video_ids or ())
+        self._explicit = bool(self._positions or self._ids)
+        self._start = config.start_index
+        self._end = config.end_index
+        self._limit = config.max_videos
+        self._archived = archived or set()
+        self.seen = 0
+        self.selected: List[PlaylistVideoInfo] = []
+        self.skipped: List[PlaylistVideoInfo] = []
+
+    def __call__(self, entry: PlaylistVideoInfo) -> bool:
+        self.seen += 1
+        if self._explicit:
+            keep = (
+                entry.playlist_index is not None
+                and entry.playlist_index in self._positions
+            ) or bool(entry.id and entry.id in self._ids)
+        else:
+            keep = (
+                self.seen >= self._start
+                and (self._end is None or self.seen <= self._end)
+                and not (self._limit and len(self.selected) >= self._limit)
+            )
+        if keep and entry.id in self._archived:
+            self.skipped.append(entry)
+            return False
+        if keep:
+            self.selected.append(entry)
+        return keep
+
+    def warn_missing(self) -> None:
+        """Log requested indices / ids that never showed up."""
+        if not self._explicit:
+            return
+        matched_positions = {
+            e.playlist_index for e in self.selected if e.playlist_index is not None
+        }
+        matched_ids = {e.id for e in self.selected if e.id}
+        if missing_pos := self._positions - matched_positions:
+            logger.warning(
+                "video_indices not found in playlist (playlist has %d entries): %s",
+                self.seen,
+                sorted(missing_pos),
+            )
+        if missing_ids := self._ids - matched_ids:
+            logger.warning("video_ids not found in playlist: %s", sorted(missing_ids))
+
+
+def _merge_intermediates(downloads: List[str], merged: Optional[str]) -> List[Path]:
+    """
+    Files a merge leaves behind if it doesn't finish.
+
+    :param downloads: Paths yt-dlp announced in ``[download] Destination:`` lines.
+    :param merged: Path announced by ``Merging formats into``, if any.
+    :return: The merge inputs plus the merger's ``.temp`` output; nothing
+             if no merge was announced, since each download is then final.
+    """
+    if merged is None:
+        return []
+    target = Path(merged)
+    paths = [Path(p) for p in downloads if p != merged]
+    paths.append(target.with_name(f"{target.stem}.temp{target.suffix}"))
+    return paths
+
+
+def _remove_partial_files(
+    directory: Path, intermediates: Optional[List[Path]] = None
+) -> bool:
+    """
+    Delete yt-dlp's partial files and the given *intermediates* from *directory*.
+
+    Only ``.part`` / ``.ytdl`` / fragment files are recognised by name;
+    anything else must have been announced by yt-dlp, so finished files
+    whose title merely looks like an intermediate are never touched.
+
+    :return: True if any were found, i.e. the download there never finished.
+    """
+    found = False
+    for item in directory.iterdir():
+        if item.is_file() and _RE_PARTIAL_FILE.search(item.name):
+            item.unlink(missing_ok=True)
+            found = True
+    for item in intermediates or ():
+        if item.parent == directory and item.is_file():
+            item.unlink(missing_ok=True)
+            found = True
+    return found
+
+
 async def _kill_process(process: asyncio.subprocess.Process) -> None:
     """
     Terminate a process and all its children.
@@ -347,6 +598,55 @@ class AsyncYT(BinaryManager):
         # Maps playlist_id → asyncio.Event (set to request cancellation)
         self._playlist_cancel_events: Dict[str, asyncio.Event] = {}
 
+    @property
+    def default_archive_file(self) -> Path:
+        """
+        Suggested ``DownloadConfig.archive_file`` location inside ``bin_dir``.
+
+        Pass it explicitly to get resume behaviour across runs, e.g.
+        ``DownloadConfig(archive_file=str(downloader.default_archive_file))``.
+        """
+        return self.bin_dir / ".archive.txt"
+
+    async def _iter_json_lines(
+        self,
+        cmd: List[str],
+        error: Callable[[int, str], Exception],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run *cmd* and yield each JSON object yt-dlp prints, one per line.
+
+        Objects are parsed as soon as their line arrives instead of after the
+        whole output has been buffered.  If the consumer stops early the
+        process is killed.
+
+        :param cmd: Full yt-dlp command line.
+        :param error: Builds the exception raised on a non-zero exit code from
+                      ``(returncode, stderr)``.
+        :raises Exception: Whatever *error* returns, once stdout is exhausted.
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=_JSON_LINE_LIMIT,
+        )
+        # Drain stderr alongside stdout so a chatty yt-dlp can't fill the pipe.
+        stderr_task = asyncio.create_task(process.stderr.read())  # type: ignore[union-attr]
+        try:
+            async for line in process.stdout:  # type: ignore[union-attr]
+                if line.strip():
+                    yield loads(line)
+            returncode = await process.wait()
+            stderr = await stderr_task
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            stderr_task.cancel()
+        if returncode != 0:
+            raise error(returncode, stderr.decode(errors="replace"))
+
     async def get_video_info(self, url: str) -> VideoInfo:
         """
         Retrieve video metadata from *url* using yt-dlp.
@@ -357,15 +657,32 @@ class AsyncYT(BinaryManager):
         """
         url = clean_youtube_url(url)
         cmd = [str(self.ytdlp_path), "--dump-json", "--no-warnings", url]
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        info: Optional[VideoInfo] = None
+        async for data in self._iter_json_lines(
+            cmd, lambda code, err: YtdlpGetInfoError(url, code, err)
+        ):
+            if info is None:
+                info = VideoInfo.from_dict(data)
+        if info is None:
+            raise YtdlpGetInfoError(url, 0, "yt-dlp returned no video info")
+        return info
+
+    def _playlist_info_cmd(self, url: str) -> List[str]:
+        """Command line that dumps one flat JSON object per playlist entry."""
+        return [
+            str(self.ytdlp_path),
+            "--dump-json",
+            "--flat-playlist",
+            "--no-warnings",
+            url,
+        ]
+
+    def _iter_playlist_json(self, url: str) -> AsyncIterator[Dict[str, Any]]:
+        """Raw flat-playlist dicts for *url*, in playlist order."""
+        return self._iter_json_lines(
+            self._playlist_info_cmd(url),
+            lambda code, err: YtdlpPlaylistGetInfoError(url, code, err),
         )
-        stdout, stderr = await process.communicate()
-        if process.returncode != 0:
-            raise YtdlpGetInfoError(url, process.returncode, stderr.decode())
-        return VideoInfo.from_dict(loads(stdout.decode()))
 
     async def get_playlist_info(
         self,
@@ -384,29 +701,36 @@ class AsyncYT(BinaryManager):
         :return: :class:`PlaylistInfo` with all :class:`PlaylistVideoInfo` entries.
         :raises YtdlpPlaylistGetInfoError: If yt-dlp fails.
         """
-        cmd = [
-            str(self.ytdlp_path),
-            "--dump-json",
-            "--flat-playlist",
-            "--no-warnings",
-            url,
-        ]
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await process.communicate()
-        if process.returncode != 0:
-            raise YtdlpPlaylistGetInfoError(url, process.returncode, stderr.decode())
-
-        raw_lines = stdout.decode().strip().splitlines()
-        raw_entries = [loads(line) for line in raw_lines if line.strip()]
-
+        raw_entries = [data async for data in self._iter_playlist_json(url)]
         return PlaylistInfo.from_ytdlp(
             raw_entries, playlist_url=url, max_videos=max_videos
         )
 
+    async def iter_playlist_info(
+        self,
+        url: str,
+        max_videos: Optional[int] = None,
+    ) -> AsyncIterator[PlaylistVideoInfo]:
+        """
+        Yield playlist entries as yt-dlp enumerates them.
+
+        Unlike :meth:`get_playlist_info` the first entries are available
+        before the whole playlist has been listed, and stopping early (or
+        hitting *max_videos*) ends the yt-dlp process.
+
+        :param url: Playlist URL.
+        :param max_videos: Stop after this many entries (None = all).
+        :return: Async iterator of :class:`PlaylistVideoInfo` with ``playlist_index`` set.
+        :raises YtdlpPlaylistGetInfoError: If yt-dlp fails.
+        """
+        async with aclosing(self._iter_playlist_json(url)) as lines:
+            index = 0
+            async for data in lines:
+                index += 1
+                yield PlaylistVideoInfo.from_flat_dict(data, index=index)
+                if max_videos and index >= max_videos:
+                    break
+
     async def _search(self, query: str, max_results: int = 10) -> List[VideoInfo]:
         """Internal YouTube search via yt-dlp."""
         search_url = f"ytsearch{max_results}:{query}"
@@ -418,18 +742,11 @@ class AsyncYT(BinaryManager):
             "live_status = 'not_live' & duration > 0",
             search_url,
         ]
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await process.communicate()
-        if process.returncode != 0:
-            raise YtdlpSearchError(query, process.returncode, stderr.decode())
         return [
-            VideoInfo.from_dict(loads(line))
-            for line in stdout.decode().strip().splitlines()
-            if line.strip()
+            VideoInfo.from_dict(data)
+            async for data in self._iter_json_lines(
+                cmd, lambda code, err: YtdlpSearchError(query, code, err)
+            )
         ]
 
     def _get_config(self, *args, **kwargs):
@@ -560,6 +877,8 @@ class AsyncYT(BinaryManager):
         :param finalize: Move output from temp dir to ``config.output_path``.
         :return: :class:`Path` to the downloaded file.
         :raises DownloadAlreadyExistsError: Same download already running.
+        :raises DownloadAlreadyArchivedError: The video is already recorded in
+            ``config.archive_file``, so yt-dlp skipped it.
         :raises YtdlpDownloadError: yt-dlp returned a non-zero exit code.
         :raises DownloadGotCanceledError: :meth:`cancel` was called.
         :raises FileNotFoundError: FFmpeg not found, or no output file produced.
@@ -605,7 +924,10 @@ class AsyncYT(BinaryManager):
         ffmpeg_parser = _FfmpegProgressParser(progress, total_duration)
         last_pct = -1.0
         last_enc_pct = -1.0
+        last_cb = 0.0
         output: List[str] = []
+        archived = False
+        pump = _CallbackPump(progress_callback, progress) if progress_callback else None
 
         try:
             # On POSIX, start_new_session=True puts the child in its own
@@ -625,31 +947,43 @@ class AsyncYT(BinaryManager):
                 output.append(line.rstrip())
                 if not line.strip():
                     continue
+                if config.archive_file and line.rstrip().endswith(_ARCHIVED_SUFFIX):
+                    archived = True
 
                 changed = _update_download_progress(
                     line.rstrip(), progress, ffmpeg_parser
                 )
 
-                if progress_callback and changed:
-                    should_fire = False
+                if pump and changed:
                     if progress.status == ProgressStatus.ENCODING:
-                        if progress.encoding_percentage != last_enc_pct:
-                            last_enc_pct = progress.encoding_percentage
-                            should_fire = True
+                        pct, prev = progress.encoding_percentage, last_enc_pct
                     else:
-                        if progress.percentage != last_pct:
-                            last_pct = progress.percentage
-                            should_fire = True
-
-                    if should_fire:
-                        await call_callback(progress_callback, progress)
+                        pct, prev = progress.percentage, last_pct
+
+                    # Throttle to one callback per progress_interval; 100 %
+                    # always goes through.
+                    now = time.monotonic()
+                    if pct != prev and (
+                        now - last_cb >= config.progress_interval or pct >= 100.0
+                    ):
+                        last_cb = now
+                        if progress.status == ProgressStatus.ENCODING:
+                            last_enc_pct = pct
+                        else:
+                            last_pct = pct
+                        pump.notify()
 
             returncode = await process.wait()
+            if pump:
+                await pump.aclose()
 
             if returncode != 0:
                 raise YtdlpDownloadError(
                     url=url, output=output, cmd=cmd, error_code=returncode
                 )
+            if archived:
+                await asyncio.to_thread(temp_dir.cleanup)
+                raise DownloadAlreadyArchivedError(url, config.archive_file)  # type: ignore[arg-type]
 
             # Completion
             progress.status = ProgressStatus.COMPLETED
@@ -678,6 +1012,8 @@ class AsyncYT(BinaryManager):
         except Exception:
             raise
         finally:
+            if pump:
+                pump.cancel()
             self._downloads.pop(id_, None)
 
     async def cancel(self, download_id: str) -> None:
@@ -815,6 +1151,218 @@ class AsyncYT(BinaryManager):
         """
         return await self.get_playlist_info(url, max_videos=max_videos)
 
+    async def _download_playlist_batch(
+        self,
+        url: str,
+        entries: List[PlaylistVideoInfo],
+        item_config: DownloadConfig,
+        skip_on_error: bool,
+        cancel_event: asyncio.Event,
+        pl_progress: PlaylistDownloadProgress,
+        emit: Callable[[], Awaitable[None]],
+    ) -> List[PlaylistItemResult]:
+        """
+        Download the selected playlist *entries* with a single yt-dlp process.
+
+        yt-dlp receives the playlist URL with ``--playlist-items``, so process
+        start-up, the HTTP session, and extractor caches are shared by every
+        item.  Each item lands in ``<temp>/<playlist_index>/``; the
+        ``Destination`` lines tell us which item is active, and an item is
+        finalized as soon as yt-dlp moves on to the next one.  ``ERROR`` lines
+        are matched back to entries by video ID.
+
+        :param url: Playlist URL.
+        :param entries: Entries to download (all must have ``playlist_index``).
+        :param item_config: Per-video :class:`DownloadConfig`.
+        :param skip_on_error: Pass ``--ignore-errors`` so failed items don't abort.
+        :param cancel_event: Set by :meth:`cancel_playlist`; kills the process.
+        :param pl_progress: Playlist progress object to update.
+        :param emit: Coroutine that reports *pl_progress* to the caller
+                     (driven through a :class:`_CallbackPump`).
+        :return: Per-item results in *entries* order.
+        :raises YtdlpDownloadError: yt-dlp failed and *skip_on_error* is False.
+        """
+        if not self.ffmpeg_path:
+            raise FileNotFoundError("FFmpeg is not installed / not found")
+
+        output_dir = Path(item_config.output_path).resolve()
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Resolved so the -o template built from it, and therefore every
+        # Destination line, shares this exact prefix for relative_to().
+        temp_path = Path(tempfile.mkdtemp()).resolve()
+        config_for_run = item_config.model_copy(update={"output_path": str(temp_path)})
+
+        by_index = {e.playlist_index: e for e in entries}
+        by_id = {e.id: e for e in entries if e.id}
+        cmd = build_playlist_command(
+            ytdlp_path=str(self.ytdlp_path),
+            ffmpeg_path=str(self.ffmpeg_path),
+            url=url,
+            config=config_for_run,
+            playlist_items=list(by_index),  # type: ignore[arg-type]
+            ignore_errors=skip_on_error,
+        )
+
+        results: Dict[int, PlaylistItemResult] = {}
+        output: List[str] = []
+        errors: Dict[str, str] = {}  # video ID → last ERROR line
+        item_dirs: Dict[int, Path] = {}  # playlist_index → yt-dlp output dir
+        downloads: Dict[int, List[str]] = {}  # playlist_index → Destination paths
+        merged: Dict[int, str] = {}  # playlist_index → merge output path
+        current: Optional[PlaylistVideoInfo] = None
+        progress: Optional[DownloadProgress] = None
+        ffmpeg_parser: Optional[_FfmpegProgressParser] = None
+        pump = _CallbackPump(emit)
+        last_cb = 0.0
+
+        def _deactivate(entry: PlaylistVideoInfo) -> None:
+            pl_progress.active_video.pop(entry.url, None)
+            pl_progress.active_downloads_progress.pop(entry.url, None)
+            pump.notify()
+
+        async def _finish(entry: PlaylistVideoInfo, returncode: int = 0) -> None:
+            """
+            Record *entry*'s result, moving its files to *output_dir* unless
+            yt-dlp reported an error for it or exited (with *returncode*)
+            while it was still downloading.
+            """
+            index = entry.playlist_index or 0
+            item_dir = item_dirs.get(index)
+            error = errors.get(entry.id)
+            moved: List[Path] = []
+            if error is None and item_dir is not None and item_dir.is_dir():
+                partial = await asyncio.to_thread(
+                    _remove_partial_files,
+                    item_dir,
+                    _merge_intermediates(downloads.get(index, []), merged.get(index)),
+                )
+                if partial and returncode != 0:
+                    error = f"yt-dlp exited with code {returncode} mid-download"
+                else:
+                    moved = await self.finalize_download(
+                        item_dir, output_dir, item_config
+                    )
+            if moved:
+                result = PlaylistItemResult(
+                    index=index, video_info=entry, success=True, filepath=str(moved[0])
+                )
+                pl_progress.completed_videos += 1
+            else:
+                result = PlaylistItemResult(
+                    index=index,
+                    video_info=entry,
+                    success=False,
+                    error=error or "No output file produced",
+                )
+                pl_progress.failed_videos += 1
+            results[index] = result
+            pl_progress._recalculate_percentage()
+            pl_progress.results.append(result)
+            _deactivate(entry)
+
+        kwargs_proc: Dict[str, Any] = dict(
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=temp_path,
+        )
+        if not _IS_WINDOWS:
+            kwargs_proc["start_new_session"] = True
+
+        try:
+            process = await asyncio.create_subprocess_exec(*cmd, **kwargs_proc)
+
+            async def _kill_on_cancel() -> None:
+                await cancel_event.wait()
+                await _kill_process(process)
+
+            watcher = asyncio.create_task(_kill_on_cancel())
+            try:
+                async for line in _read_process_output(process):
+                    line = line.rstrip()
+                    output.append(line)
+                    if not line.strip():
+                        continue
+                    em = _RE_ITEM_ERROR.match(line)
+                    if em and em.group(1) in by_id:
+                        errors[em.group(1)] = line
+
+                    # Switch the active entry when yt-dlp starts writing into
+                    # another <playlist_index>/ directory.
+                    dest = _destination(line)
+                    if dest is not None:
+                        try:
+                            # yt-dlp may zero-pad %(playlist_index)s
+                            item_dir = (
+                                temp_path / Path(dest).relative_to(temp_path).parts[0]
+                            )
+                            index = int(item_dir.name)
+                        except (ValueError, IndexError):
+                            index = None
+                        entry = by_index.get(index)
+                        if entry is not None and entry is not current:
+                            if current is not None:
+                                await _finish(current)
+                            item_dirs[index] = item_dir  # type: ignore[index]
+                            current = entry
+                            progress = DownloadProgress(
+                                id=get_id(entry.url, item_config), url=entry.url
+                            )
+                            ffmpeg_parser = _FfmpegProgressParser(
+                                progress, entry.duration
+                            )
+                            pl_progress.active_video[entry.url] = entry
+                            pl_progress.active_downloads_progress[entry.url] = progress
+                            pl_progress.current_index = index or 0
+                            pump.notify()
+                        if entry is not None:
+                            if line.startswith(_DESTINATION_MARKERS[0]):
+                                downloads.setdefault(index, []).append(dest)  # type: ignore[arg-type]
+                            elif _DESTINATION_MARKERS[1] in line:
+                                merged[index] = dest  # type: ignore[index]
+
+                    if progress is None or ffmpeg_parser is None:
+                        continue
+                    if _update_download_progress(line, progress, ffmpeg_parser):
+                        now = time.monotonic()
+                        if now - last_cb >= item_config.progress_interval:
+                            last_cb = now
+                            pump.notify()
+
+                returncode = await process.wait()
+            finally:
+                watcher.cancel()
+                if process.returncode is None:
+                    await _kill_process(process)
+
+            if current is not None:
+                if cancel_event.is_set():
+                    # Killed mid-item: leave its partial files to the rmtree
+                    _deactivate(current)
+                else:
+                    await _finish(current, returncode)
+
+            # Items yt-dlp never reached (unavailable, filtered, aborted, ...)
+            if not cancel_event.is_set():
+                for entry in entries:
+                    if (entry.playlist_index or 0) not in results:
+                        await _finish(entry)
+            await pump.aclose()
+        finally:
+            pump.cancel()
+            await asyncio.to_thread(shutil.rmtree, temp_path, True)
+
+        if returncode != 0 and not skip_on_error and not cancel_event.is_set():
+            raise YtdlpDownloadError(
+                url=url, output=output, cmd=cmd, error_code=returncode
+            )
+
+        return [
+            results[e.playlist_index or 0]
+            for e in entries
+            if (e.playlist_index or 0) in results
+        ]
+
     async def download_playlist(
         self,
         url: Optional[str] = None,
@@ -828,7 +1376,8 @@ class AsyncYT(BinaryManager):
         """
         Download all (or a subset of) videos from a playlist.
 
-        Supports concurrent downloads via ``PlaylistConfig.concurrency``.
+        Supports concurrent downloads via ``PlaylistConfig.concurrency``; with
+        ``concurrency=1`` all selected videos are fetched by one yt-dlp process.
         Progress is reported through *progress_callback* with a
         :class:`PlaylistDownloadProgress` that includes both the overall
         playlist state and per-video :class:`DownloadProgress` for every
@@ -875,71 +1424,11 @@ class AsyncYT(BinaryManager):
         await _emit()
 
         try:
-            # --- Fetch playlist info ---
-            try:
-                playlist_info = await self.get_playlist_info(url, max_videos=None)  # type: ignore[arg-type]
-            except YtdlpPlaylistGetInfoError as exc:
-                raise PlaylistDownloadError(url, str(exc)) from exc  # type: ignore[arg-type]
-
-            # --- Entry filtering (unchanged logic) ---
-            entries = playlist_info.entries
-            use_explicit = bool(
-                playlist_config.video_indices or playlist_config.video_ids
-            )
-
-            if use_explicit:
-                wanted_positions: set[int] = set()
-                wanted_ids: set[str] = set()
-
-                if playlist_config.video_indices:
-                    wanted_positions = set(playlist_config.video_indices)
-                if playlist_config.video_ids:
-                    wanted_ids = set(playlist_config.video_ids)
-
-                filtered: list[PlaylistVideoInfo] = []
-                for entry in entries:
-                    in_positions = (
-                        entry.playlist_index is not None
-                        and entry.playlist_index in wanted_positions
-                    )
-                    in_ids = bool(entry.id and entry.id in wanted_ids)
-                    if in_positions or in_ids:
-                        filtered.append(entry)
-
-                matched_positions = {
-                    e.playlist_index for e in filtered if e.playlist_index is not None
-                }
-                matched_ids = {e.id for e in filtered if e.id}
-                if missing_pos := wanted_positions - matched_positions:
-                    logger.warning(
-                        "video_indices not found in playlist (playlist has %d entries): %s",
-                        len(entries),
-                        sorted(missing_pos),
-                    )
-                if missing_ids := wanted_ids - matched_ids:
-                    logger.warning(
-                        "video_ids not found in playlist: %s", sorted(missing_ids)
-                    )
-
-                entries = filtered
-            else:
-                start = playlist_config.start_index - 1
-                end = playlist_config.end_index
-                entries = entries[start:end]
-                if playlist_config.max_videos:
-                    entries = entries[: playlist_config.max_videos]
-
-            if playlist_config.reverse:
-                entries = list(reversed(entries))
-
-            pl_progress.playlist_info = playlist_info
-            pl_progress.total_videos = len(entries)
-            pl_progress.status = PlaylistStatus.DOWNLOADING
-            await _emit()
-
             results: List[PlaylistItemResult] = []
             downloaded_files: List[str] = []
             semaphore = asyncio.Semaphore(playlist_config.concurrency)
+            # Set by the first failing item when skip_on_error is False.
+            abort = asyncio.Event()
 
             async def _download_one(entry: PlaylistVideoInfo) -> PlaylistItemResult:
                 """Download a single playlist entry, respecting the semaphore."""
@@ -982,7 +1471,9 @@ class AsyncYT(BinaryManager):
                             filepath=str(filepath),
                         )
 
-                    except DownloadGotCanceledError:
+                    except (DownloadGotCanceledError, asyncio.CancelledError) as exc:
+                        # A bare CancelledError means the task was cancelled
+                        # before download() could turn it into its own error.
                         async with _progress_lock:
                             pl_progress.failed_videos += 1
                             pl_progress._recalculate_percentage()
@@ -993,6 +1484,8 @@ class AsyncYT(BinaryManager):
                             success=False,
                             error="Cancelled",
                         )
+                        if isinstance(exc, asyncio.CancelledError):
+                            raise
 
                     except Exception as exc:
                         logger.warning("Playlist item %s failed: %s", video_url, exc)
@@ -1008,6 +1501,7 @@ class AsyncYT(BinaryManager):
                             error=str(exc),
                         )
                         if not playlist_config.skip_on_error:
+                            abort.set()
                             raise
 
                     finally:
@@ -1019,36 +1513,119 @@ class AsyncYT(BinaryManager):
                     await _emit()
                     return result # type: ignore
 
+            # --- Fetch playlist info ---
+            # Concurrent downloads start as soon as their entry is listed, so
+            # enumeration of a long playlist overlaps with downloading.  The
+            # sequential batch and reversed order need the full selection.
+            overlap = playlist_config.concurrency > 1 and not playlist_config.reverse
+            archived: set[str] = set()
+            if item_config.archive_file:
+                archived = await asyncio.to_thread(
+                    read_download_archive, item_config.archive_file
+                )
+            select = _EntrySelector(playlist_config, archived)
+            raw_entries: List[Dict[str, Any]] = []
+            tasks: List[asyncio.Task] = []
+            try:
+                async with aclosing(self._iter_playlist_json(url)) as lines:  # type: ignore[arg-type]
+                    async for data in lines:
+                        if cancel_event.is_set() or abort.is_set():
+                            break
+                        raw_entries.append(data)
+                        entry = PlaylistVideoInfo.from_flat_dict(
+                            data, index=len(raw_entries)
+                        )
+                        if select(entry) and overlap:
+                            tasks.append(asyncio.create_task(_download_one(entry)))
+                            pl_progress.total_videos += 1
+                            pl_progress.status = PlaylistStatus.DOWNLOADING
+            except BaseException as exc:
+                # However enumeration ended, don't leave started downloads running.
+                for t in tasks:
+                    t.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                if isinstance(exc, YtdlpPlaylistGetInfoError):
+                    raise PlaylistDownloadError(url, str(exc)) from exc  # type: ignore[arg-type]
+                raise
+
+            playlist_info = PlaylistInfo.from_ytdlp(raw_entries, playlist_url=url)  # type: ignore[arg-type]
+            select.warn_missing()
+            if select.skipped:
+                logger.info(
+                    "Skipping %d videos already in the download archive",
+                    len(select.skipped),
+                )
+            entries = select.selected
+
+            if playlist_config.reverse:
+                entries = list(reversed(entries))
+
+            pl_progress.playlist_info = playlist_info
+            pl_progress.total_videos = len(entries)
+            pl_progress.status = PlaylistStatus.DOWNLOADING
+            await _emit()
+
             # --- Run downloads ---
-            if playlist_config.concurrency == 1:
-                for entry in entries:
-                    if cancel_event.is_set():
-                        break
-                    result = await _download_one(entry)
-                    results.append(result)
-                    if result.filepath:
-                        downloaded_files.append(result.filepath)
-            else:
-                tasks = [asyncio.create_task(_download_one(e)) for e in entries]
+            # Sequential downloads from one playlist share a single yt-dlp
+            # process; otherwise every entry gets its own task and the
+            # semaphore caps how many yt-dlp processes run at once.
+            use_batch = playlist_config.concurrency == 1 and all(
+                e.playlist_index is not None for e in entries
+            )
+            if use_batch and entries:
+                results = await self._download_playlist_batch(
+                    url,  # type: ignore[arg-type]
+                    entries,
+                    item_config,
+                    playlist_config.skip_on_error,
+                    cancel_event,
+                    pl_progress,
+                    _emit,
+                )
+                downloaded_files = [r.filepath for r in results if r.filepath]
+            elif not use_batch:
+                if not overlap:
+                    tasks = [asyncio.create_task(_download_one(e)) for e in entries]
+                done: set[asyncio.Task] = set()
                 try:
-                    done_results = await asyncio.gather(*tasks, return_exceptions=True)
-                    for r in done_results:
-                        if isinstance(r, PlaylistItemResult):
-                            results.append(r)
-                            if r.filepath:
-                                downloaded_files.append(r.filepath)
-                        elif (
-                            isinstance(r, Exception)
-                            and not playlist_config.skip_on_error
-                        ):
-                            raise r
+                    if tasks:
+                        done, _ = await asyncio.wait(
+                            tasks, return_when=asyncio.FIRST_EXCEPTION
+                        )
                 except asyncio.CancelledError:
                     for t in tasks:
                         t.cancel()
                     raise
 
+                # A task only raises when skip_on_error is False.  Remember the
+                # one that stopped the wait before cancelling the rest, so its
+                # error is reported rather than a cancelled sibling's.
+                failure = next(
+                    (
+                        t.exception()
+                        for t in tasks
+                        if t in done and not t.cancelled() and t.exception()
+                    ),
+                    None,
+                )
+                for t in tasks:
+                    if not t.done():
+                        t.cancel()
+
+                done_results = await asyncio.gather(*tasks, return_exceptions=True)
+                for r in done_results:
+                    if isinstance(r, PlaylistItemResult):
+                        results.append(r)
+                        if r.filepath:
+                            downloaded_files.append(r.filepath)
+                if failure is not None and not playlist_config.skip_on_error:
+                    raise failure
+
             was_cancelled = cancel_event.is_set()
-            success = pl_progress.completed_videos > 0
+            # Nothing left to fetch because everything is archived is a success.
+            success = pl_progress.completed_videos > 0 or (
+                not entries and bool(select.skipped)
+            )
 
             pl_progress.status = (
                 PlaylistStatus.CANCELLED
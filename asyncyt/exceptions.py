@@ -5,6 +5,7 @@ __all__ = [
     "DownloadGotCanceledError",
     "DownloadAlreadyExistsError",
     "DownloadNotFoundError",
+    "DownloadAlreadyArchivedError",
     "YtdlpDownloadError",
     "YtdlpSearchError",
     "YtdlpGetInfoError",
@@ -62,6 +63,16 @@ class DownloadNotFoundError(DownloaderBase):
         super().__init__(message)
 
 
+class DownloadAlreadyArchivedError(DownloaderBase, FileNotFoundError):
+    """Raised when yt-dlp skips a video already recorded in the download archive."""
+
+    def __init__(self, url: str, archive_file: str):
+        message = f"{url} is already recorded in the download archive '{archive_file}'."
+        self.url = url
+        self.archive_file = archive_file
+        super().__init__(message)
+
+
 class YtdlpDownloadError(YtDlpBase, RuntimeError):
     """Raised when an error occurs in yt-dlp downloading."""
 
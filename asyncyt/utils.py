@@ -13,6 +13,7 @@ __all__ = [
     "get_id",
     "get_unique_path",
     "clean_youtube_url",
+    "read_download_archive",
 ]
 
 
@@ -135,3 +136,22 @@ def clean_youtube_url(url: str) -> str:
         return urlunparse(parsed)
 
     return url
+
+
+def read_download_archive(path: str | Path) -> set[str]:
+    """
+    Read the video IDs recorded in a yt-dlp download archive.
+
+    Each archive line is ``"<extractor> <video id>"``; a missing file is
+    treated as an empty archive.
+
+    :param path: Archive file path.
+    :type path: str | Path
+    :return: Set of archived video IDs.
+    :rtype: set[str]
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {vid for line in f if (vid := line.strip().partition(" ")[2])}
+    except FileNotFoundError:
+        return set()
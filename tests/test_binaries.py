@@ -0,0 +1,191 @@
+# tests/test_binaries.py
+import hashlib
+import io
+import zipfile
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from asyncyt import AsyncYT, ProgressStatus
+from asyncyt import binaries
+
+
+class _Releases:
+    """Serves ``path -> (body, etag)`` with If-None-Match and Range support."""
+
+    def __init__(self):
+        self.files = {}
+        self.requests = []
+
+    async def handle(self, request):
+        body, etag = self.files[request.path]
+        self.requests.append((request.path, dict(request.headers)))
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+        headers = {"ETag": etag}
+        range_ = request.headers.get("Range")
+        if range_:
+            start = int(range_.removeprefix("bytes=").rstrip("-"))
+            return web.Response(status=206, body=body[start:], headers=headers)
+        return web.Response(body=body, headers=headers)
+
+    def sent(self, path, header):
+        return [h.get(header) for p, h in self.requests if p == path]
+
+
+@asynccontextmanager
+async def _serve():
+    releases = _Releases()
+    app = web.Application()
+    app.router.add_get("/{name}", releases.handle)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield releases, str(server.make_url("/"))
+    finally:
+        await server.close()
+
+
+@pytest.fixture(autouse=True)
+def _no_retry_backoff(monkeypatch):
+    async def retry_now(url, attempt, error, what="failed"):
+        pass
+
+    monkeypatch.setattr(binaries.BinaryManager, "_wait_before_retry", retry_now)
+
+
+def _ffmpeg_zip(version):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as z:
+        z.writestr("ffmpeg/bin/ffmpeg.exe", f"ffmpeg-{version}")
+        z.writestr("ffmpeg/bin/ffprobe.exe", f"ffprobe-{version}")
+    return buffer.getvalue()
+
+
+async def _download(yt, url, path, conditional=False):
+    last = None
+    async with yt:
+        async for last in yt._download_file(
+            url,
+            path,
+            etag_path=yt._etag_path(path),
+            conditional=conditional,
+            digest_path=yt._digest_path(path),
+        ):
+            pass
+    return last
+
+
+@pytest.mark.asyncio
+async def test_download_saves_etag_and_revalidates(tmp_path):
+    yt = AsyncYT(tmp_path)
+    target = tmp_path / "yt-dlp"
+    async with _serve() as (releases, base):
+        releases.files["/yt-dlp"] = (b"binary-v1", '"v1"')
+
+        last = await _download(yt, base + "yt-dlp", target)
+        assert last.status == ProgressStatus.DOWNLOADING
+        assert target.read_bytes() == b"binary-v1"
+        assert yt._etag_path(target).read_text() == '"v1"'
+
+        mtime = target.stat().st_mtime_ns
+        last = await _download(yt, base + "yt-dlp", target, conditional=True)
+        assert last.status == ProgressStatus.COMPLETED
+        assert releases.sent("/yt-dlp", "If-None-Match") == [None, '"v1"']
+        assert target.stat().st_mtime_ns == mtime
+
+        releases.files["/yt-dlp"] = (b"binary-v2", '"v2"')
+        await _download(yt, base + "yt-dlp", target, conditional=True)
+        assert target.read_bytes() == b"binary-v2"
+        assert yt._etag_path(target).read_text() == '"v2"'
+
+
+@pytest.mark.asyncio
+async def test_download_resumes_partial_file(tmp_path):
+    yt = AsyncYT(tmp_path)
+    target = tmp_path / "yt-dlp"
+    body = bytes(range(256)) * 64
+    target.with_suffix(".part").write_bytes(body[:1000])
+    async with _serve() as (releases, base):
+        releases.files["/yt-dlp"] = (body, '"v1"')
+        await _download(yt, base + "yt-dlp", target)
+    assert releases.sent("/yt-dlp", "Range") == ["bytes=1000-"]
+    assert target.read_bytes() == body
+    assert not target.with_suffix(".part").exists()
+
+
+@pytest.mark.asyncio
+async def test_ffmpeg_overwritten_only_when_forced(tmp_path, monkeypatch):
+    async with _serve() as (releases, base):
+        monkeypatch.setattr(binaries, "_IS_WIN", True)
+        monkeypatch.setattr(binaries, "_IS_MAC", False)
+        monkeypatch.setattr(binaries, "_YTDLP_URL", base + "yt-dlp")
+        monkeypatch.setattr(binaries, "_FFMPEG_URL", base + "ffmpeg.zip")
+        releases.files["/yt-dlp"] = (b"binary", '"y1"')
+        releases.files["/ffmpeg.zip"] = (_ffmpeg_zip("v1"), '"f1"')
+        yt = AsyncYT(tmp_path)
+        ffmpeg = tmp_path / "ffmpeg.exe"
+
+        await yt.setup_binaries()
+        assert ffmpeg.read_text() == "ffmpeg-v1"
+
+        releases.files["/ffmpeg.zip"] = (_ffmpeg_zip("v2"), '"f2"')
+        await yt.setup_binaries()
+        assert ffmpeg.read_text() == "ffmpeg-v1"
+        assert len(releases.sent("/ffmpeg.zip", "If-None-Match")) == 1
+
+        await yt.update_binaries()
+        assert ffmpeg.read_text() == "ffmpeg-v2"
+        assert (tmp_path / "ffprobe.exe").read_text() == "ffprobe-v2"
+        assert releases.sent("/ffmpeg.zip", "If-None-Match")[-1] == '"f1"'
+
+        mtime = ffmpeg.stat().st_mtime_ns
+        await yt.update_binaries()
+        assert releases.sent("/ffmpeg.zip", "If-None-Match")[-1] == '"f2"'
+        assert ffmpeg.stat().st_mtime_ns == mtime
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("resume_at", [0, 1000])
+async def test_digest_matches_streamed_bytes(tmp_path, resume_at):
+    yt = AsyncYT(tmp_path)
+    target = tmp_path / "yt-dlp"
+    body = bytes(range(256)) * 64
+    if resume_at:
+        # Resumed bytes are hashed from the .part file, not the stream
+        target.with_suffix(".part").write_bytes(body[:resume_at])
+    async with _serve() as (releases, base):
+        releases.files["/yt-dlp"] = (body, '"v1"')
+        await _download(yt, base + "yt-dlp", target)
+    assert yt._digest_path(target).read_text() == hashlib.sha256(body).hexdigest()
+    assert await yt._verify_digest(target)
+
+
+@pytest.mark.asyncio
+async def test_corrupt_ytdlp_redownloaded_despite_etag(tmp_path, monkeypatch):
+    async with _serve() as (releases, base):
+        monkeypatch.setattr(binaries, "_YTDLP_URL", base + "yt-dlp")
+        releases.files["/yt-dlp"] = (b"binary-v1", '"v1"')
+        yt = AsyncYT(tmp_path)
+        async with yt:
+            async for _ in yt._setup_ytdlp():
+                pass
+        assert releases.sent("/yt-dlp", "If-None-Match") == [None]
+
+        # Same release on the server, but the local copy got truncated
+        yt.ytdlp_path.write_bytes(b"binary")
+        assert not await yt._verify_digest(yt.ytdlp_path)
+        async with yt:
+            async for _ in yt._setup_ytdlp():
+                pass
+        assert releases.sent("/yt-dlp", "If-None-Match") == [None, None]
+        assert yt.ytdlp_path.read_bytes() == b"binary-v1"
+        assert await yt._verify_digest(yt.ytdlp_path)
+
+        # An intact binary is kept by the 304
+        async with yt:
+            async for _ in yt._setup_ytdlp():
+                pass
+        assert releases.sent("/yt-dlp", "If-None-Match")[-1] == '"v1"'
@@ -1,6 +1,7 @@
 # tests/test_config.py
 import pytest
-from asyncyt import DownloadConfig, AudioFormat
+from asyncyt import DownloadConfig, AudioFormat, read_download_archive
+from asyncyt.builder import build_download_command
 
 def test_valid_config():
     config = DownloadConfig(
@@ -13,3 +14,26 @@ def test_valid_config():
 def test_invalid_rate_limit():
     with pytest.raises(ValueError):
         DownloadConfig(rate_limit="999X") 
+
+def test_archive_file_in_command(tmp_path):
+    archive = tmp_path / "archive.txt"
+    config = DownloadConfig(output_path=str(tmp_path), archive_file=str(archive))
+    cmd = build_download_command("yt-dlp", "ffmpeg", "https://x/v", config)
+    assert cmd[cmd.index("--download-archive") + 1] == str(archive.resolve())
+
+def test_read_download_archive(tmp_path):
+    archive = tmp_path / "archive.txt"
+    archive.write_text("youtube abc123\n\nyoutube def456\n")
+    assert read_download_archive(archive) == {"abc123", "def456"}
+    assert read_download_archive(tmp_path / "missing.txt") == set()
+
+def test_cached_command_tracks_config_changes(tmp_path):
+    config = DownloadConfig(output_path=str(tmp_path / "a"))
+    first = build_download_command("yt-dlp", "ffmpeg", "https://x/v", config)
+    other = config.model_copy(update={"output_path": str(tmp_path / "b")})
+    second = build_download_command("yt-dlp", "ffmpeg", "https://x/v", other)
+    assert first[first.index("-o") + 1].startswith(str(tmp_path / "a"))
+    assert second[second.index("-o") + 1].startswith(str(tmp_path / "b"))
+    config.retries = 7
+    third = build_download_command("yt-dlp", "ffmpeg", "https://x/v", config)
+    assert third[third.index("--retries") + 1] == "7"
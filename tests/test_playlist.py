@@ -0,0 +1,148 @@
+# tests/test_playlist.py
+import sys
+
+import pytest
+from asyncyt import AsyncYT, DownloadConfig, PlaylistConfig, PlaylistVideoInfo
+from asyncyt.builder import build_playlist_command
+from asyncyt.core import (
+    _CallbackPump,
+    _EntrySelector,
+    _destination,
+    _merge_intermediates,
+    _remove_partial_files,
+    _split_ffmpeg_kv,
+)
+
+
+def _entries(n):
+    return [
+        PlaylistVideoInfo(id=f"v{i}", url=f"https://x/{i}", playlist_index=i)
+        for i in range(1, n + 1)
+    ]
+
+
+def _select(config, archived=None, n=6):
+    select = _EntrySelector(config, archived)
+    return [e.playlist_index for e in _entries(n) if select(e)], select
+
+
+def test_playlist_command(tmp_path):
+    cmd = build_playlist_command(
+        ytdlp_path="yt-dlp",
+        ffmpeg_path="ffmpeg",
+        url="https://x/pl",
+        config=DownloadConfig(output_path=str(tmp_path)),
+        playlist_items=[3, 1],
+    )
+    assert cmd[-2:] == ["--", "https://x/pl"]
+    assert cmd[cmd.index("--playlist-items") + 1] == "3,1"
+    assert "--yes-playlist" in cmd and "--ignore-errors" in cmd
+    template = cmd[cmd.index("-o") + 1]
+    assert template.startswith(str(tmp_path.resolve() / "%(playlist_index)s"))
+
+
+def test_playlist_command_without_ignore_errors(tmp_path):
+    cmd = build_playlist_command(
+        ytdlp_path="yt-dlp",
+        ffmpeg_path="ffmpeg",
+        url="https://x/pl",
+        config=DownloadConfig(output_path=str(tmp_path)),
+        playlist_items=[1],
+        ignore_errors=False,
+    )
+    assert "--ignore-errors" not in cmd
+
+
+def test_selector_range():
+    picked, select = _select(PlaylistConfig(start_index=2, end_index=5, max_videos=3))
+    assert picked == [2, 3, 4]
+    assert select.seen == 6
+
+
+def test_selector_explicit_overrides_range():
+    picked, _ = _select(
+        PlaylistConfig(video_indices=[1, 5], video_ids=["v3"], start_index=4)
+    )
+    assert picked == [1, 3, 5]
+
+
+def test_selector_skips_archived():
+    picked, select = _select(PlaylistConfig(max_videos=2), archived={"v1"})
+    assert picked == [2, 3]
+    assert [e.id for e in select.skipped] == ["v1"]
+
+
+def test_destination():
+    assert _destination("[download] Destination: /t/01/A.mp4") == "/t/01/A.mp4"
+    assert _destination('[Merger] Merging formats into "/t/01/A.mp4"') == "/t/01/A.mp4"
+    assert _destination("[download]  45.3% of 5.00MiB") is None
+
+
+def test_split_ffmpeg_kv():
+    assert _split_ffmpeg_kv("out_time=00:00:05.123") == ("out_time", "00:00:05.123")
+    assert _split_ffmpeg_kv("[download] a=b") is None
+
+
+def test_remove_partial_files_keeps_finished_lookalikes(tmp_path):
+    names = ("Race.f1.mp4", "A.temp.mp4", "A.mp4.part", "A.mp4.ytdl", "A.mp4.part-Frag3")
+    for name in names:
+        (tmp_path / name).write_text("x")
+    assert _remove_partial_files(tmp_path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["A.temp.mp4", "Race.f1.mp4"]
+    assert not _remove_partial_files(tmp_path)
+
+
+def test_remove_announced_merge_intermediates(tmp_path):
+    for name in ("A.f137.mp4", "A.f140.m4a", "A.temp.mp4", "B.f1.mp4"):
+        (tmp_path / name).write_text("x")
+    downloads = [str(tmp_path / "A.f137.mp4"), str(tmp_path / "A.f140.m4a")]
+    intermediates = _merge_intermediates(downloads, str(tmp_path / "A.mp4"))
+    assert _remove_partial_files(tmp_path, intermediates)
+    assert [p.name for p in tmp_path.iterdir()] == ["B.f1.mp4"]
+    # Without a merge, an announced download is the finished file
+    assert _merge_intermediates([str(tmp_path / "B.f1.mp4")], None) == []
+
+
+@pytest.mark.asyncio
+async def test_callback_pump_delivers_latest():
+    seen = []
+    state = {"n": 0}
+    pump = _CallbackPump(lambda: seen.append(state["n"]))
+    for n in range(1, 4):
+        state["n"] = n
+        pump.notify()
+    await pump.aclose()
+    assert seen == [3]
+
+
+FAKE_YTDLP = """#!{python}
+import json, sys, time
+args = sys.argv[1:]
+if "--flat-playlist" in args:
+    for vid in ("a", "bad", "c"):
+        print(json.dumps({{"id": vid, "url": "https://x/" + vid}}))
+    sys.exit(0)
+if "--dump-json" in args:
+    if args[-1].endswith("bad"):
+        sys.exit(1)
+    time.sleep(5)
+sys.exit(1)
+"""
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_reports_the_failing_item(tmp_path):
+    ytdlp = tmp_path / "yt-dlp"
+    ytdlp.write_text(FAKE_YTDLP.format(python=sys.executable))
+    ytdlp.chmod(0o755)
+    yt = AsyncYT(tmp_path)
+    yt.ytdlp_path = ytdlp
+
+    config = PlaylistConfig(
+        concurrency=3,
+        skip_on_error=False,
+        item_config=DownloadConfig(output_path=str(tmp_path / "out")),
+    )
+    response = await yt.download_playlist("https://x/pl", config)
+    assert not response.success
+    assert response.error == "Download failed for https://x/bad"
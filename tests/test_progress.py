@@ -0,0 +1,31 @@
+# tests/test_progress.py
+import pytest
+from asyncyt.core import _FfmpegProgressParser, _parse_size, _update_download_progress
+from asyncyt.basemodels import DownloadProgress
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        ("512B", 512),
+        ("10.5KiB", 10752),
+        ("1.5MB", 1_500_000),
+        ("~  2.00GiB", 2 * 1024**3),
+        ("42", 42),
+        ("1.2.3MiB", 0),
+        ("3iB", 0),
+        ("N/A", 0),
+    ],
+)
+def test_parse_size(size, expected):
+    assert _parse_size(size) == expected
+
+
+def test_download_line_fills_bytes():
+    progress = DownloadProgress(id="x", url="u")
+    parser = _FfmpegProgressParser(progress, 0.0)
+    line = "[download]  25.0% of ~  4.00MiB at    3.20MiB/s ETA 00:08"
+    assert _update_download_progress(line, progress, parser)
+    assert progress.total_bytes == 4 * 1024**2
+    assert progress.downloaded_bytes == 1024**2
+    assert progress.eta == 8